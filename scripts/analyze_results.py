@@ -8,6 +8,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 import typer
 
 from src.mechgaia_env.database import BenchmarkDatabase
@@ -70,9 +71,7 @@ def analyze(
     # Aggregate scores
     results = []
     for (task_id, model_name), scores in task_model_scores.items():
-        aggregated = aggregate_scores(
-            [{"scores": {score_key: s}} for s in scores], score_key=score_key
-        )
+        aggregated = aggregate_scores(np.asarray(scores, dtype=float))
 
         results.append(
             {"task_id": task_id, "model_name": model_name, "statistics": aggregated}
@@ -101,17 +100,7 @@ def analyze(
     for result in results:
         task_id = result["task_id"]
         # Determine level from task_id or database
-        task = next(
-            (
-                t
-                for t in db.get_tasks_by_level("A")
-                + db.get_tasks_by_level("B")
-                + db.get_tasks_by_level("C")
-                + db.get_tasks_by_level("D")
-                if t["id"] == task_id
-            ),
-            None,
-        )
+        task = db.get_task_by_id(task_id)
         if task:
             level = task["level"]
             level_results[level].append(result)
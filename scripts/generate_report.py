@@ -10,6 +10,7 @@ from typing import Any, Dict, List
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 import typer
 
 from src.mechgaia_env.database import BenchmarkDatabase
@@ -286,10 +287,7 @@ def generate(
         for key, result in task_results.items():
             primary_scores = result["scores"][primary_key]
             if primary_scores:
-                aggregated = aggregate_scores(
-                    [{"scores": {primary_key: s}} for s in primary_scores],
-                    score_key=primary_key,
-                )
+                aggregated = aggregate_scores(np.asarray(primary_scores, dtype=float))
                 result["statistics"] = aggregated
 
         # Generate level section
@@ -0,0 +1,132 @@
+"""Level A task templates (fundamentals): multiple choice concept questions."""
+
+TEMPLATES = [
+    {
+        "topic": "Linear vs Nonlinear Elasticity",
+        "question": "Which statement best describes the difference between linear and nonlinear elasticity?",
+        "options": [
+            "Linear elasticity assumes constant Young's modulus, while nonlinear elasticity allows modulus to vary with strain",
+            "Linear elasticity only applies to metals, while nonlinear elasticity applies to polymers",
+            "Linear elasticity ignores Poisson's ratio, while nonlinear elasticity includes it",
+            "Linear and nonlinear elasticity are identical concepts with different names",
+        ],
+        "correct_option": 0,
+        "distractor_analysis": [
+            "Explain why linear elasticity can apply to both metals and polymers",
+            "Clarify that Poisson's ratio is part of linear elasticity theory",
+            "Distinguish between linear/nonlinear elasticity and material types",
+        ],
+    },
+    {
+        "topic": "Yield vs Ultimate Strength",
+        "question": "What is the key difference between yield strength and ultimate tensile strength?",
+        "options": [
+            "Yield strength is the stress at which permanent deformation begins, while ultimate strength is the maximum stress before fracture",
+            "Yield strength applies only to compression, while ultimate strength applies to tension",
+            "Yield strength is always higher than ultimate strength",
+            "They are the same property measured at different temperatures",
+        ],
+        "correct_option": 0,
+        "distractor_analysis": [
+            "Clarify that yield strength applies to both tension and compression",
+            "Explain that ultimate strength is typically higher than yield strength",
+            "Distinguish between strength properties and temperature effects",
+        ],
+    },
+    {
+        "topic": "Fatigue Mechanisms",
+        "question": "What is the primary mechanism of fatigue failure in metals?",
+        "options": [
+            "Progressive crack initiation and propagation under cyclic loading",
+            "Sudden brittle fracture without warning",
+            "Gradual reduction in Young's modulus",
+            "Chemical corrosion at the surface",
+        ],
+        "correct_option": 0,
+        "distractor_analysis": [
+            "Distinguish between fatigue (progressive) and brittle fracture (sudden)",
+            "Clarify that fatigue affects strength, not necessarily modulus",
+            "Separate mechanical fatigue from chemical corrosion mechanisms",
+        ],
+    },
+    {
+        "topic": "Fracture Modes",
+        "question": "What distinguishes ductile fracture from brittle fracture?",
+        "options": [
+            "Ductile fracture involves significant plastic deformation before failure, while brittle fracture occurs with minimal deformation",
+            "Ductile fracture only occurs in metals, while brittle fracture only occurs in ceramics",
+            "Ductile fracture happens at high temperatures, brittle at low temperatures",
+            "There is no difference; they are the same phenomenon",
+        ],
+        "correct_option": 0,
+        "distractor_analysis": [
+            "Explain that both metals and ceramics can exhibit either mode depending on conditions",
+            "Clarify that temperature affects but doesn't solely determine fracture mode",
+            "Emphasize the fundamental difference in deformation behavior",
+        ],
+    },
+    {
+        "topic": "Failure Criteria",
+        "question": "When is the von Mises failure criterion most appropriate?",
+        "options": [
+            "For ductile materials under multiaxial stress states",
+            "For brittle materials under uniaxial tension",
+            "For materials with anisotropic properties",
+            "For all materials regardless of ductility",
+        ],
+        "correct_option": 0,
+        "distractor_analysis": [
+            "Explain why von Mises is not suitable for brittle materials",
+            "Clarify that von Mises assumes isotropic behavior",
+            "Distinguish between criteria for different material types",
+        ],
+    },
+    {
+        "topic": "Stress-Strain Curve Interpretation",
+        "question": "On a typical stress-strain curve for a ductile metal, what does the area under the curve up to the ultimate tensile strength represent?",
+        "options": [
+            "The toughness or energy absorbed per unit volume before necking begins",
+            "The elastic modulus of the material",
+            "The yield strength multiplied by the strain",
+            "The total elongation of the specimen",
+        ],
+        "correct_option": 0,
+        "distractor_analysis": [
+            "Clarify that elastic modulus is the slope of the linear region, not the area",
+            "Explain that yield strength times strain is only part of the area",
+            "Distinguish between energy absorption (area) and geometric deformation (elongation)",
+        ],
+    },
+    {
+        "topic": "Creep vs Relaxation",
+        "question": "What is the key difference between creep and stress relaxation?",
+        "options": [
+            "Creep occurs under constant stress with increasing strain, while relaxation occurs under constant strain with decreasing stress",
+            "Creep only happens at high temperatures, while relaxation occurs at room temperature",
+            "Creep applies to metals, while relaxation applies to polymers",
+            "They are the same phenomenon with different names",
+        ],
+        "correct_option": 0,
+        "distractor_analysis": [
+            "Clarify that both creep and relaxation are temperature-dependent but can occur at various temperatures",
+            "Explain that both metals and polymers can exhibit creep and relaxation",
+            "Emphasize the fundamental difference: constant stress vs constant strain conditions",
+        ],
+    },
+    {
+        "topic": "Composite Material Anisotropy",
+        "question": "Why are fiber-reinforced composite materials typically anisotropic?",
+        "options": [
+            "The mechanical properties differ along different directions due to the oriented fiber reinforcement",
+            "Composite materials are always isotropic regardless of fiber orientation",
+            "Anisotropy only occurs in metal matrix composites, not polymer matrix composites",
+            "The matrix material determines anisotropy, not the fibers",
+        ],
+        "correct_option": 0,
+        "distractor_analysis": [
+            "Clarify that fiber orientation creates anisotropy in both metal and polymer matrix composites",
+            "Explain that while the matrix contributes, fiber orientation is the primary source of anisotropy",
+            "Distinguish between isotropic matrix materials and anisotropic composite behavior",
+        ],
+    },
+]
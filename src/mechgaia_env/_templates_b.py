@@ -0,0 +1,220 @@
+"""Level B task templates (parametric calculations)."""
+
+TEMPLATES = [
+    {
+        "topic": "Euler-Bernoulli Beam Deflection",
+        "problem_template": "A simply supported beam of length L = {L} m carries a point load P = {P} kN at its center. The beam has a rectangular cross-section with width b = {b} mm and height h = {h} mm. The material has Young's modulus E = {E} GPa. Calculate the maximum deflection at the center of the beam.",
+        "symbolic_variables": {
+            "P": "Point load at center",
+            "L": "Beam length",
+            "E": "Young's modulus",
+            "b": "Cross-section width",
+            "h": "Cross-section height",
+        },
+        "units": {"P": "kN", "L": "m", "E": "GPa", "b": "mm", "h": "mm"},
+        "ground_truth_formula": "P * 1000 * L**3 / (48 * E * 1e9 * b * h**3 / 12)",
+        "parameter_ranges": {
+            "P": {"min": 1, "max": 100},
+            "L": {"min": 1, "max": 10},
+            "E": {"min": 200, "max": 210},
+            "b": {"min": 50, "max": 200},
+            "h": {"min": 100, "max": 500},
+        },
+        "tolerance": 0.01,
+    },
+    {
+        "topic": "Axial Bar Extension",
+        "problem_template": "A steel bar of length L = {L} m and cross-sectional area A = {A} mm² is subjected to an axial tensile force P = {P} kN. The material has Young's modulus E = {E} GPa. Calculate the elongation of the bar.",
+        "symbolic_variables": {
+            "P": "Axial force",
+            "L": "Bar length",
+            "A": "Cross-sectional area",
+            "E": "Young's modulus",
+        },
+        "units": {"P": "kN", "L": "m", "A": "mm²", "E": "GPa"},
+        "ground_truth_formula": "P * 1000 * L / (E * 1e9 * A * 1e-6)",
+        "parameter_ranges": {
+            "P": {"min": 10, "max": 500},
+            "L": {"min": 0.5, "max": 5},
+            "A": {"min": 100, "max": 1000},
+            "E": {"min": 200, "max": 210},
+        },
+        "tolerance": 0.01,
+    },
+    {
+        "topic": "Cantilever Beam Tip Deflection",
+        "problem_template": "A cantilever beam of length L = {L} m carries a point load P = {P} kN at its free end. The beam has a rectangular cross-section with width b = {b} mm and height h = {h} mm. The material has Young's modulus E = {E} GPa. Calculate the tip deflection.",
+        "symbolic_variables": {
+            "P": "Point load at tip",
+            "L": "Beam length",
+            "E": "Young's modulus",
+            "b": "Cross-section width",
+            "h": "Cross-section height",
+        },
+        "units": {"P": "kN", "L": "m", "E": "GPa", "b": "mm", "h": "mm"},
+        "ground_truth_formula": "P * 1000 * L**3 / (3 * E * 1e9 * b * h**3 / 12)",
+        "parameter_ranges": {
+            "P": {"min": 1, "max": 50},
+            "L": {"min": 0.5, "max": 5},
+            "E": {"min": 200, "max": 210},
+            "b": {"min": 50, "max": 200},
+            "h": {"min": 100, "max": 400},
+        },
+        "tolerance": 0.01,
+    },
+    {
+        "topic": "Torsional Shaft Angle of Twist",
+        "problem_template": "A circular shaft of length L = {L} m and diameter d = {d} mm is subjected to a torque T = {T} N⋅m. The material has shear modulus G = {G} GPa. Calculate the angle of twist in radians.",
+        "symbolic_variables": {
+            "T": "Applied torque",
+            "L": "Shaft length",
+            "d": "Shaft diameter",
+            "G": "Shear modulus",
+        },
+        "units": {"T": "N⋅m", "L": "m", "d": "mm", "G": "GPa"},
+        "ground_truth_formula": "T * L / (G * 1e9 * 3.14159 * (d * 1e-3 / 2)**4 / 2)",
+        "parameter_ranges": {
+            "T": {"min": 100, "max": 10000},
+            "L": {"min": 0.5, "max": 3},
+            "d": {"min": 20, "max": 100},
+            "G": {"min": 75, "max": 80},
+        },
+        "tolerance": 0.01,
+    },
+    {
+        "topic": "Thin-Walled Pressure Vessel Hoop Stress",
+        "problem_template": "A thin-walled cylindrical pressure vessel has an internal radius r = {r} mm and wall thickness t = {t} mm. The vessel is subjected to an internal pressure p = {p} MPa. Calculate the hoop stress.",
+        "symbolic_variables": {
+            "p": "Internal pressure",
+            "r": "Internal radius",
+            "t": "Wall thickness",
+        },
+        "units": {"p": "MPa", "r": "mm", "t": "mm"},
+        "ground_truth_formula": "p * 1e6 * r * 1e-3 / (t * 1e-3)",
+        "parameter_ranges": {
+            "p": {"min": 0.5, "max": 10},
+            "r": {"min": 50, "max": 500},
+            "t": {"min": 2, "max": 20},
+        },
+        "tolerance": 0.01,
+    },
+    {
+        "topic": "Column Buckling Critical Load",
+        "problem_template": "A column of length L = {L} m with a rectangular cross-section (width b = {b} mm, height h = {h} mm) is pinned at both ends. The material has Young's modulus E = {E} GPa. Calculate the Euler buckling critical load.",
+        "symbolic_variables": {
+            "L": "Column length",
+            "E": "Young's modulus",
+            "b": "Cross-section width",
+            "h": "Cross-section height",
+        },
+        "units": {"L": "m", "E": "GPa", "b": "mm", "h": "mm"},
+        "ground_truth_formula": "3.14159**2 * E * 1e9 * b * h**3 / (12 * L**2)",
+        "parameter_ranges": {
+            "L": {"min": 1, "max": 5},
+            "E": {"min": 200, "max": 210},
+            "b": {"min": 50, "max": 200},
+            "h": {"min": 100, "max": 300},
+        },
+        "tolerance": 0.01,
+    },
+    {
+        "topic": "Bending Stress in Beam",
+        "problem_template": "A simply supported beam of length L = {L} m carries a uniform distributed load w = {w} kN/m. The beam has a rectangular cross-section with width b = {b} mm and height h = {h} mm. Calculate the maximum bending stress at midspan.",
+        "symbolic_variables": {
+            "w": "Distributed load",
+            "L": "Beam length",
+            "b": "Cross-section width",
+            "h": "Cross-section height",
+        },
+        "units": {"w": "kN/m", "L": "m", "b": "mm", "h": "mm"},
+        "ground_truth_formula": "w * 1000 * L**2 / 8 * (h * 1e-3 / 2) / (b * h**3 / 12)",
+        "parameter_ranges": {
+            "w": {"min": 1, "max": 50},
+            "L": {"min": 2, "max": 8},
+            "b": {"min": 50, "max": 200},
+            "h": {"min": 150, "max": 400},
+        },
+        "tolerance": 0.01,
+    },
+    {
+        "topic": "Combined Axial and Bending Stress",
+        "problem_template": "A column of length L = {L} m with rectangular cross-section (width b = {b} mm, height h = {h} mm) is subjected to an axial compressive force P = {P} kN and a bending moment M = {M} kN⋅m. The material has Young's modulus E = {E} GPa. Calculate the maximum combined stress (compressive).",
+        "symbolic_variables": {
+            "P": "Axial compressive force",
+            "M": "Bending moment",
+            "L": "Column length",
+            "b": "Cross-section width",
+            "h": "Cross-section height",
+            "E": "Young's modulus",
+        },
+        "units": {
+            "P": "kN",
+            "M": "kN⋅m",
+            "L": "m",
+            "b": "mm",
+            "h": "mm",
+            "E": "GPa",
+        },
+        "ground_truth_formula": "P * 1000 / (b * h * 1e-6) + M * 1000 * (h * 1e-3 / 2) / (b * h**3 / 12)",
+        "parameter_ranges": {
+            "P": {"min": 50, "max": 500},
+            "M": {"min": 5, "max": 50},
+            "L": {"min": 2, "max": 6},
+            "b": {"min": 100, "max": 300},
+            "h": {"min": 150, "max": 400},
+            "E": {"min": 200, "max": 210},
+        },
+        "tolerance": 0.01,
+    },
+    {
+        "topic": "Thin Plate Bending Deflection",
+        "problem_template": "A simply supported rectangular plate with dimensions a = {a} m (length) and b = {b} m (width) is subjected to a uniform pressure p = {p} kPa. The plate has thickness t = {t} mm and material properties E = {E} GPa and Poisson's ratio nu = {nu}. Calculate the maximum deflection at the center of the plate.",
+        "symbolic_variables": {
+            "p": "Uniform pressure",
+            "a": "Plate length",
+            "b": "Plate width",
+            "t": "Plate thickness",
+            "E": "Young's modulus",
+            "nu": "Poisson's ratio",
+        },
+        "units": {
+            "p": "kPa",
+            "a": "m",
+            "b": "m",
+            "t": "mm",
+            "E": "GPa",
+            "nu": "dimensionless",
+        },
+        "ground_truth_formula": "p * 1000 * a**4 * (5 - nu) / (384 * E * 1e9 * (t * 1e-3)**3 / (12 * (1 - nu**2)))",
+        "parameter_ranges": {
+            "p": {"min": 1, "max": 20},
+            "a": {"min": 0.5, "max": 2.0},
+            "b": {"min": 0.5, "max": 2.0},
+            "t": {"min": 5, "max": 25},
+            "E": {"min": 200, "max": 210},
+            "nu": {"min": 0.25, "max": 0.30},
+        },
+        "tolerance": 0.01,
+    },
+    {
+        "topic": "Energy Methods (Castigliano) for Deflection",
+        "problem_template": "A cantilever beam of length L = {L} m carries a point load P = {P} kN at its free end. The beam has a rectangular cross-section with width b = {b} mm and height h = {h} mm. The material has Young's modulus E = {E} GPa. Using Castigliano's theorem, calculate the tip deflection.",
+        "symbolic_variables": {
+            "P": "Point load at tip",
+            "L": "Beam length",
+            "b": "Cross-section width",
+            "h": "Cross-section height",
+            "E": "Young's modulus",
+        },
+        "units": {"P": "kN", "L": "m", "b": "mm", "h": "mm", "E": "GPa"},
+        "ground_truth_formula": "P * 1000 * L**3 / (3 * E * 1e9 * b * h**3 / 12)",
+        "parameter_ranges": {
+            "P": {"min": 1, "max": 50},
+            "L": {"min": 0.5, "max": 5},
+            "b": {"min": 50, "max": 200},
+            "h": {"min": 100, "max": 400},
+            "E": {"min": 200, "max": 210},
+        },
+        "tolerance": 0.01,
+    },
+]
@@ -0,0 +1,290 @@
+"""Level C task templates (design & optimization)."""
+
+# Material choices shared by several Level C templates
+STEEL_ALUMINUM = ("steel", "aluminum")
+STEEL_ALUMINUM_TITANIUM = ("steel", "aluminum", "titanium")
+STEEL_CONCRETE = ("steel", "concrete")
+
+TEMPLATES = [
+    {
+        "topic": "Cantilever Beam Frequency Optimization",
+        "objectives": ["Maximize natural frequency", "Minimize mass"],
+        "constraints": [
+            "Maximum deflection < 10 mm under static load",
+            "Stress < yield strength",
+            "Frequency > 50 Hz",
+        ],
+        "design_variables": {
+            "length": {
+                "type": "continuous",
+                "min": 0.5,
+                "max": 2.0,
+                "unit": "m",
+            },
+            "width": {
+                "type": "continuous",
+                "min": 0.05,
+                "max": 0.2,
+                "unit": "m",
+            },
+            "height": {
+                "type": "continuous",
+                "min": 0.1,
+                "max": 0.3,
+                "unit": "m",
+            },
+            "material": {
+                "type": "categorical",
+                "options": STEEL_ALUMINUM_TITANIUM,
+            },
+        },
+        "reference_design": {
+            "length": 1.0,
+            "width": 0.1,
+            "height": 0.2,
+            "material": "steel",
+        },
+        "material_options": STEEL_ALUMINUM_TITANIUM,
+        "evaluation_criteria": {"frequency_weight": 0.6, "mass_weight": 0.4},
+    },
+    {
+        "topic": "Simply Supported Beam Mass Minimization",
+        "objectives": ["Minimize mass", "Maximize stiffness"],
+        "constraints": [
+            "Maximum deflection < 5 mm under distributed load",
+            "Maximum stress < 200 MPa",
+            "Beam length fixed at 3.0 m",
+        ],
+        "design_variables": {
+            "width": {
+                "type": "continuous",
+                "min": 0.08,
+                "max": 0.25,
+                "unit": "m",
+            },
+            "height": {
+                "type": "continuous",
+                "min": 0.15,
+                "max": 0.40,
+                "unit": "m",
+            },
+            "material": {
+                "type": "categorical",
+                "options": STEEL_ALUMINUM,
+            },
+        },
+        "reference_design": {
+            "width": 0.15,
+            "height": 0.25,
+            "material": "steel",
+        },
+        "material_options": STEEL_ALUMINUM,
+        "evaluation_criteria": {"mass_weight": 0.7, "stiffness_weight": 0.3},
+    },
+    {
+        "topic": "Column Design for Maximum Load Capacity",
+        "objectives": [
+            "Maximize buckling load",
+            "Minimize cross-sectional area",
+        ],
+        "constraints": [
+            "Column length fixed at 4.0 m",
+            "Slenderness ratio < 200",
+            "Material yield strength > 250 MPa",
+        ],
+        "design_variables": {
+            "width": {
+                "type": "continuous",
+                "min": 0.10,
+                "max": 0.30,
+                "unit": "m",
+            },
+            "height": {
+                "type": "continuous",
+                "min": 0.10,
+                "max": 0.30,
+                "unit": "m",
+            },
+            "material": {
+                "type": "categorical",
+                "options": STEEL_ALUMINUM,
+            },
+        },
+        "reference_design": {
+            "width": 0.15,
+            "height": 0.20,
+            "material": "steel",
+        },
+        "material_options": STEEL_ALUMINUM,
+        "evaluation_criteria": {"load_weight": 0.6, "area_weight": 0.4},
+    },
+    {
+        "topic": "Pressure Vessel Wall Thickness Optimization",
+        "objectives": ["Minimize wall thickness", "Maximize safety factor"],
+        "constraints": [
+            "Internal pressure = 5 MPa",
+            "Vessel radius = 0.5 m",
+            "Safety factor >= 2.0",
+            "Hoop stress < yield strength",
+        ],
+        "design_variables": {
+            "thickness": {
+                "type": "continuous",
+                "min": 0.005,
+                "max": 0.050,
+                "unit": "m",
+            },
+            "material": {
+                "type": "categorical",
+                "options": STEEL_ALUMINUM,
+            },
+        },
+        "reference_design": {
+            "thickness": 0.015,
+            "material": "steel",
+        },
+        "material_options": STEEL_ALUMINUM,
+        "evaluation_criteria": {"thickness_weight": 0.5, "safety_weight": 0.5},
+    },
+    {
+        "topic": "Shaft Design for Torsional Strength",
+        "objectives": ["Maximize torque capacity", "Minimize diameter"],
+        "constraints": [
+            "Shaft length = 2.0 m",
+            "Maximum shear stress < 100 MPa",
+            "Angle of twist < 0.1 rad",
+        ],
+        "design_variables": {
+            "diameter": {
+                "type": "continuous",
+                "min": 0.05,
+                "max": 0.20,
+                "unit": "m",
+            },
+            "material": {
+                "type": "categorical",
+                "options": STEEL_ALUMINUM,
+            },
+        },
+        "reference_design": {
+            "diameter": 0.10,
+            "material": "steel",
+        },
+        "material_options": STEEL_ALUMINUM,
+        "evaluation_criteria": {"torque_weight": 0.6, "diameter_weight": 0.4},
+    },
+    {
+        "topic": "Truss Member Sizing Under Combined Load Cases",
+        "objectives": [
+            "Minimize total member cross-sectional area",
+            "Satisfy stress constraints under multiple load combinations",
+        ],
+        "constraints": [
+            "Maximum tensile stress < 200 MPa",
+            "Maximum compressive stress < 150 MPa",
+            "Member buckling factor > 2.0",
+            "Truss geometry fixed (span = 6 m, height = 3 m)",
+        ],
+        "design_variables": {
+            "top_chord_area": {
+                "type": "continuous",
+                "min": 500,
+                "max": 2000,
+                "unit": "mm²",
+            },
+            "bottom_chord_area": {
+                "type": "continuous",
+                "min": 500,
+                "max": 2000,
+                "unit": "mm²",
+            },
+            "diagonal_area": {
+                "type": "continuous",
+                "min": 300,
+                "max": 1500,
+                "unit": "mm²",
+            },
+            "material": {
+                "type": "categorical",
+                "options": STEEL_ALUMINUM,
+            },
+        },
+        "reference_design": {
+            "top_chord_area": 1200,
+            "bottom_chord_area": 1000,
+            "diagonal_area": 600,
+            "material": "steel",
+        },
+        "material_options": STEEL_ALUMINUM,
+        "evaluation_criteria": {"area_weight": 0.7, "safety_weight": 0.3},
+    },
+    {
+        "topic": "Plate Thickness Optimization Under Pressure",
+        "objectives": [
+            "Minimize plate thickness",
+            "Maximize safety factor against yielding",
+        ],
+        "constraints": [
+            "Internal pressure = 3 MPa",
+            "Plate radius = 0.8 m",
+            "Maximum deflection < 5 mm",
+            "Safety factor >= 2.5",
+        ],
+        "design_variables": {
+            "thickness": {
+                "type": "continuous",
+                "min": 0.008,
+                "max": 0.040,
+                "unit": "m",
+            },
+            "material": {
+                "type": "categorical",
+                "options": STEEL_ALUMINUM,
+            },
+        },
+        "reference_design": {
+            "thickness": 0.015,
+            "material": "steel",
+        },
+        "material_options": STEEL_ALUMINUM,
+        "evaluation_criteria": {"thickness_weight": 0.6, "safety_weight": 0.4},
+    },
+    {
+        "topic": "Multi-Column Layout Optimization for Slab",
+        "objectives": [
+            "Minimize number of columns",
+            "Minimize total column cross-sectional area",
+        ],
+        "constraints": [
+            "Slab span between columns < 5 m",
+            "Column buckling load > applied load",
+            "Maximum column stress < 150 MPa",
+            "Slab area = 200 m²",
+        ],
+        "design_variables": {
+            "column_spacing": {
+                "type": "continuous",
+                "min": 3.0,
+                "max": 5.0,
+                "unit": "m",
+            },
+            "column_diameter": {
+                "type": "continuous",
+                "min": 0.20,
+                "max": 0.40,
+                "unit": "m",
+            },
+            "material": {
+                "type": "categorical",
+                "options": STEEL_CONCRETE,
+            },
+        },
+        "reference_design": {
+            "column_spacing": 4.5,
+            "column_diameter": 0.30,
+            "material": "steel",
+        },
+        "material_options": STEEL_CONCRETE,
+        "evaluation_criteria": {"spacing_weight": 0.5, "area_weight": 0.5},
+    },
+]
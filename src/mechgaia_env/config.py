@@ -22,9 +22,11 @@ class BenchmarkConfig(BaseSettings):
     # Bootstrap configuration
     bootstrap_iterations: int = 1000
     confidence_level: float = 0.95
+    bootstrap_seed: int | None = None  # set for reproducible intervals
 
     # Sandbox configuration
     sandbox_timeout: int = 30  # seconds
+    sandbox_isolated: bool = False  # run code in worker processes to enforce timeout
 
     # A2A client configuration
     a2a_timeout: float = 600.0  # seconds (10 minutes for long-running agent operations)
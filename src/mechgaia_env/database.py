@@ -3,10 +3,41 @@
 import json
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.mechgaia_env.config import config
 
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _orjson_default(obj: Any) -> Any:
+        """Serialize float subclasses that orjson rejects but json accepts."""
+        if isinstance(obj, float):
+            return float(obj)
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string with orjson."""
+        return orjson.dumps(
+            obj, default=_orjson_default, option=_ORJSON_OPTIONS
+        ).decode("utf-8")
+
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+def _schema_data_json(schema_data: Any) -> str:
+    """Ensure schema_data is a JSON string for storage."""
+    if isinstance(schema_data, dict):
+        return _json_dumps(schema_data)
+    return str(schema_data)
+
 
 class BenchmarkDatabase:
     """SQLite database for storing tasks, instances, and evaluations."""
@@ -128,21 +159,40 @@ class BenchmarkDatabase:
         schema_data: Dict[str, Any],
     ):
         """Add a task to the database."""
+        self.add_tasks_bulk([(task_id, level, topic, schema_type, schema_data)])
+
+    def add_tasks_bulk(self, tasks: List[Tuple[str, str, str, str, Dict[str, Any]]]):
+        """Add several tasks to the database in a single transaction.
+
+        Existing tasks with the same id are replaced, but rows whose stored
+        values are already identical are left untouched, so regenerating the
+        same tasks writes nothing.
+
+        Args:
+            tasks: List of (task_id, level, topic, schema_type, schema_data) tuples
+        """
+        rows = [
+            (task_id, level, topic, schema_type, _schema_data_json(schema_data))
+            for task_id, level, topic, schema_type, schema_data in tasks
+        ]
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        # Ensure schema_data is JSON string
-        if isinstance(schema_data, dict):
-            schema_data_str = json.dumps(schema_data)
-        else:
-            schema_data_str = str(schema_data)
-
-        cursor.execute(
+        cursor.executemany(
             """
-            INSERT OR REPLACE INTO tasks (id, level, topic, schema_type, schema_data)
+            INSERT INTO tasks (id, level, topic, schema_type, schema_data)
             VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                level = excluded.level,
+                topic = excluded.topic,
+                schema_type = excluded.schema_type,
+                schema_data = excluded.schema_data
+            WHERE (level, topic, schema_type, schema_data)
+                IS NOT (excluded.level, excluded.topic, excluded.schema_type,
+                        excluded.schema_data)
         """,
-            (task_id, level, topic, schema_type, schema_data_str),
+            rows,
         )
 
         conn.commit()
@@ -157,22 +207,43 @@ class BenchmarkDatabase:
         metadata: Optional[Dict[str, Any]] = None,
     ):
         """Add a task instance to the database."""
+        self.add_task_instances_bulk(
+            [(instance_id, task_id, parameters, gold_answer, metadata)]
+        )
+
+    def add_task_instances_bulk(
+        self,
+        instances: List[
+            Tuple[str, str, Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]
+        ],
+    ):
+        """Add several task instances to the database in a single transaction.
+
+        Args:
+            instances: List of (instance_id, task_id, parameters, gold_answer,
+                metadata) tuples
+        """
+        rows = [
+            (
+                instance_id,
+                task_id,
+                _json_dumps(parameters),
+                _json_dumps(gold_answer),
+                _json_dumps(metadata or {}),
+            )
+            for instance_id, task_id, parameters, gold_answer, metadata in instances
+        ]
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        cursor.execute(
+        cursor.executemany(
             """
             INSERT OR REPLACE INTO task_instances 
             (id, task_id, parameters, gold_answer, metadata)
             VALUES (?, ?, ?, ?, ?)
         """,
-            (
-                instance_id,
-                task_id,
-                json.dumps(parameters),
-                json.dumps(gold_answer),
-                json.dumps(metadata or {}),
-            ),
+            rows,
         )
 
         conn.commit()
@@ -200,8 +271,8 @@ class BenchmarkDatabase:
                 eval_id,
                 task_instance_id,
                 model_name,
-                json.dumps(response),
-                json.dumps(scores),
+                _json_dumps(response),
+                _json_dumps(scores),
             ),
         )
 
@@ -230,13 +301,42 @@ class BenchmarkDatabase:
             # Parse schema_data if it's a JSON string
             if "schema_data" in r and isinstance(r["schema_data"], str):
                 try:
-                    r["schema_data"] = json.loads(r["schema_data"])
+                    r["schema_data"] = _json_loads(r["schema_data"])
                 except:
                     pass  # Keep as string if not valid JSON
             result.append(r)
 
         return result
 
+    def get_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single task by its id, or None if it does not exist."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT * FROM tasks WHERE id = ? LIMIT 1
+        """,
+            (task_id,),
+        )
+
+        row = cursor.fetchone()
+        conn.close()
+
+        if row is None:
+            return None
+
+        result = dict(row)
+        # Parse schema_data if it's a JSON string
+        if isinstance(result["schema_data"], str):
+            try:
+                result["schema_data"] = _json_loads(result["schema_data"])
+            except ValueError:
+                pass  # Keep as string if not valid JSON
+
+        return result
+
     def get_available_levels(self) -> List[str]:
         """Get all available levels that have tasks in the database."""
         conn = sqlite3.connect(self.db_path)
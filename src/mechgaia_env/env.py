@@ -3,7 +3,9 @@
 # Type hints are handled inline
 
 import json
-from typing import Optional
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Dict, Optional
 
 from pydantic import BaseModel
 
@@ -12,6 +14,39 @@ from src.mechgaia_env.sandbox import SandboxExecutor
 from src.mechgaia_env.toolbox import EngineeringToolbox
 
 
+@lru_cache(maxsize=256)
+def _compile_problem_template(template: str) -> Callable[[Dict[str, Any]], str]:
+    """Pre-parse a problem template's placeholders into a reusable renderer.
+
+    Templates with only named placeholders are split once into literal and
+    field parts; anything else (positional, attribute or index fields,
+    conversions, nested specs) falls back to str.format.
+
+    Args:
+        template: Problem template with {name} placeholders
+
+    Returns:
+        Function rendering the template from a parameter dictionary
+    """
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if field is not None and (
+            not field.isidentifier() or conversion or "{" in spec
+        ):
+            return lambda parameters: template.format(**parameters)
+        parts.append((literal, field, spec))
+
+    def render(parameters: Dict[str, Any]) -> str:
+        pieces = []
+        for literal, field, spec in parts:
+            pieces.append(literal)
+            if field is not None:
+                pieces.append(format(parameters[field], spec))
+        return "".join(pieces)
+
+    return render
+
+
 class EnvInfo(BaseModel):
     """Environment info returned by reset/step."""
 
@@ -244,7 +279,7 @@ Use the available tools to solve this problem step by step.
             # Level B: parametric calculation
             template = schema_data.get("problem_template", "")
             parameters = instance.get("parameters", {})
-            problem_text = template.format(**parameters)
+            problem_text = _compile_problem_template(template)(parameters)
             return {
                 "problem_text": problem_text,
                 "level": "B",
@@ -2,7 +2,121 @@
 
 import json
 import re
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+try:
+    from orjson import loads as _json_loads  # orjson.JSONDecodeError subclasses json's
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    from json import loads as _json_loads
+
+    ORJSON_AVAILABLE = False
+
+# JSON5 accepts trailing commas, comments and unquoted keys that LLMs often emit
+try:
+    from pyjson5 import loads as _json5_loads
+except ImportError:
+    try:
+        from json5 import loads as _json5_loads
+    except ImportError:
+        _json5_loads = None
+
+# Patterns are compiled once at import and shared by every parse call.
+
+# A signed integer, decimal or scientific-notation number
+_NUM = r"[-+]?\d+\.?\d*(?:[eE][-+]?\d+)?"
+
+# Multiple choice option selection
+_OPTION_RE = re.compile(r"option\s*(\d+)")
+_NUMBERED_OPTION_RE = re.compile(r"(?:^|\s|option\s*)(\d+)[\.\)]")
+_ANSWER_IS_OPTION_RE = re.compile(
+    r"(?:correct\s+)?(?:answer|option|choice)\s+is\s*:?\s*(\d+)"
+)
+_EXPLICIT_OPTION_RE = re.compile(r"(\d+)\s+is\s+(?:the\s+)?(?:correct|right|answer)")
+# Words that indicate a bare number refers to an answer option
+_OPTION_CONTEXT_RE = re.compile(r"option|answer|correct|choice|select")
+
+# Numerical answer patterns in order of specificity, matched against lowercased text
+_NUMERIC_ANSWER_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        # Explicit answer statements: "answer is 123.45", "the answer is 123.45"
+        rf"(?:the\s+)?(?:answer|result|solution|value|final\s+answer|final\s+result)\s*(?:is|:|=)\s*({_NUM})",
+        # Standalone equals: "= 123.45"
+        rf"=\s*({_NUM})",
+        # With units: "123.45 Pa", "123.45 MPa"
+        rf"({_NUM})\s*(?:pa|mpa|n|kn|m|mm|kg|g|nm|knm)",
+        # In parentheses: "(123.45)" or "answer (123.45)"
+        rf"(?:answer|result|solution)\s*\(({_NUM})\)",
+        # After colon: "Answer: 123.45" or "Result: 123.45"
+        rf"(?:answer|result|solution|value)\s*:\s*({_NUM})",
+        # Standalone number at end of sentence: "The stress is 123.45."
+        rf"is\s+({_NUM})\s*[\.\s]",
+        # In code execution results: look for print statements or return values
+        rf"(?:print|result|return|output)\s*[=:]\s*({_NUM})",
+        # Scientific notation: "1.23e-4" or "1.23E-4"
+        r"([-+]?\d+\.?\d*[eE][-+]?\d+)",
+    )
+)
+
+# Fallback: a decimal number within a short window after an answer keyword
+_FALLBACK_KEYWORDS = ("answer", "result", "solution", "value", "final")
+_FALLBACK_WINDOW = 100
+_DECIMAL_RE = re.compile(r"[-+]?\d+\.\d+(?:[eE][-+]?\d+)?")
+
+# Code snippets
+_CODE_BLOCK_RE = re.compile(r"```(?:python)?\s*\n(.*?)```", re.DOTALL)
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+# Tokens that suggest an inline code span is Python code
+_PY_KEYWORD_RE = re.compile(r"import|def|=|print|return")
+
+# JSON output
+_JSON_BLOCK_RE = re.compile(r"```json\s*\n(.*?)```", re.DOTALL)
+_TRAILING_COMMA_OBJECT_RE = re.compile(r",\s*}")
+_TRAILING_COMMA_ARRAY_RE = re.compile(r",\s*]")
+_JSON_DESIGN_START_RE = re.compile(r"(\{[^{}]*design[^{}]*\})", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+# Design parameters in free text
+_PARAM_EQUALS_RE = re.compile(
+    rf"(\w+)\s*=\s*({_NUM})\s*(?:m|mm|cm|kg|g|pa|mpa|hz)?",
+    re.IGNORECASE,
+)
+_PARAM_OF_RE = re.compile(
+    rf"(\w+)\s+(?:of|is)\s+({_NUM})\s*(?:m|mm|cm|kg|g|pa|mpa|hz)?",
+    re.IGNORECASE,
+)
+_PARAM_COLON_RE = re.compile(rf"(\w+)\s*:\s*({_NUM})", re.IGNORECASE)
+_FREQUENCY_RE = re.compile(
+    rf"(?:natural\s+)?frequency\s+(?:of|is|:)?\s*({_NUM})\s*hz",
+    re.IGNORECASE,
+)
+
+# Answers in code and execution output
+_CODE_PRINT_RE = re.compile(rf"print\s*\([^)]*({_NUM})")
+_CODE_RETURN_RE = re.compile(rf"return\s+({_NUM})")
+_CODE_ASSIGN_RE = re.compile(
+    rf"(?:result|answer|solution|value|final)\s*=\s*({_NUM})",
+    re.IGNORECASE,
+)
+_EXEC_RESULT_RE = re.compile(
+    rf"(?:execution\s+)?(?:result|output|value)\s*:?\s*({_NUM})",
+    re.IGNORECASE,
+)
+
+
+def _last_group(pattern: re.Pattern, text: str) -> Optional[str]:
+    """Return the first group of the last match of a pattern, or None.
+
+    Iterates with finditer so only the latest match is kept instead of
+    materializing every match as findall does.
+    """
+    last = None
+    for last in pattern.finditer(text):
+        pass
+    return last.group(1) if last is not None else None
 
 
 def extract_selected_option(response_text: str, num_options: int = 4) -> Optional[int]:
@@ -18,52 +132,73 @@ def extract_selected_option(response_text: str, num_options: int = 4) -> Optiona
     response_lower = response_text.lower()
 
     # Pattern 1: "option 1", "option 2", etc.
-    option_pattern = r"option\s*(\d+)"
-    matches = re.findall(option_pattern, response_lower)
-    if matches:
-        option_num = int(matches[-1])  # Take last mention
+    match = _last_group(_OPTION_RE, response_lower)
+    if match is not None:
+        option_num = int(match)  # Take last mention
         if 1 <= option_num <= num_options:
             return option_num - 1  # Convert to 0-indexed
 
     # Pattern 2: "1.", "2.", etc. at start of line or after "option"
-    numbered_pattern = r"(?:^|\s|option\s*)(\d+)[\.\)]"
-    matches = re.findall(numbered_pattern, response_text)
-    if matches:
-        # Check if any match is a valid option number
-        for match in matches:
-            option_num = int(match)
-            if 1 <= option_num <= num_options:
-                # Verify it's actually referring to an option
-                # Look for context like "correct option", "answer is", etc.
-                idx = response_text.lower().find(match)
-                context = response_text[
-                    max(0, idx - 20) : min(len(response_text), idx + 20)
-                ].lower()
-                if any(
-                    word in context
-                    for word in ["option", "answer", "correct", "choice", "select"]
-                ):
-                    return option_num - 1
+    # Stop at the first valid option number that is referred to as an option
+    for match in _NUMBERED_OPTION_RE.finditer(response_text):
+        option_num = int(match.group(1))
+        if 1 <= option_num <= num_options:
+            # Verify it's actually referring to an option
+            # Look for context like "correct option", "answer is", etc.
+            idx = match.start(1)
+            # Bound the search instead of slicing out a context substring
+            if _OPTION_CONTEXT_RE.search(response_lower, max(0, idx - 20), idx + 20):
+                return option_num - 1
 
     # Pattern 3: "The correct answer is 1" or "Answer: 2"
-    answer_pattern = r"(?:correct\s+)?(?:answer|option|choice)\s+is\s*:?\s*(\d+)"
-    matches = re.findall(answer_pattern, response_lower)
-    if matches:
-        option_num = int(matches[-1])
+    match = _last_group(_ANSWER_IS_OPTION_RE, response_lower)
+    if match is not None:
+        option_num = int(match)
         if 1 <= option_num <= num_options:
             return option_num - 1
 
     # Pattern 4: Look for explicit statement like "1 is correct" or "option 1 is the right answer"
-    explicit_pattern = r"(\d+)\s+is\s+(?:the\s+)?(?:correct|right|answer)"
-    matches = re.findall(explicit_pattern, response_lower)
-    if matches:
-        option_num = int(matches[-1])
+    match = _last_group(_EXPLICIT_OPTION_RE, response_lower)
+    if match is not None:
+        option_num = int(match)
         if 1 <= option_num <= num_options:
             return option_num - 1
 
     return None
 
 
+def _find_number_after_keyword(text: str) -> Optional[str]:
+    """Find the decimal number following the last answer keyword in the text.
+
+    Keyword positions are located with str.rfind and the number is searched only
+    within a bounded window after each keyword, so there is no backtracking over
+    the whole response.
+
+    Args:
+        text: Lowercased response text
+
+    Returns:
+        Matched number string or None if not found
+    """
+    best_idx = -1
+    best_match = None
+
+    for keyword in _FALLBACK_KEYWORDS:
+        idx = text.rfind(keyword)
+        # Walk occurrences from the end; the first hit is the latest for this keyword
+        while idx > best_idx:
+            start = idx + len(keyword)
+            # Extra room past the window lets a number that starts inside it finish
+            match = _DECIMAL_RE.search(text, start, start + 2 * _FALLBACK_WINDOW)
+            if match and match.start() - start <= _FALLBACK_WINDOW:
+                best_idx = idx
+                best_match = match.group()
+                break
+            idx = text.rfind(keyword, 0, idx)
+
+    return best_match
+
+
 def extract_numerical_answer(response_text: str) -> Optional[float]:
     """Extract numerical answer from response text.
 
@@ -73,33 +208,16 @@ def extract_numerical_answer(response_text: str) -> Optional[float]:
     Returns:
         Numerical value or None if not found
     """
-    # Enhanced patterns to catch more answer formats
-    patterns = [
-        # Explicit answer statements: "answer is 123.45", "the answer is 123.45"
-        r"(?:the\s+)?(?:answer|result|solution|value|final\s+answer|final\s+result)\s*(?:is|:|=)\s*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)",
-        # Standalone equals: "= 123.45"
-        r"=\s*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)",
-        # With units: "123.45 Pa", "123.45 MPa"
-        r"([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)\s*(?:pa|mpa|n|kn|m|mm|kg|g|nm|knm)",
-        # In parentheses: "(123.45)" or "answer (123.45)"
-        r"(?:answer|result|solution)\s*\(([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)\)",
-        # After colon: "Answer: 123.45" or "Result: 123.45"
-        r"(?:answer|result|solution|value)\s*:\s*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)",
-        # Standalone number at end of sentence: "The stress is 123.45."
-        r"is\s+([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)\s*[\.\s]",
-        # In code execution results: look for print statements or return values
-        r"(?:print|result|return|output)\s*[=:]\s*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)",
-        # Scientific notation: "1.23e-4" or "1.23E-4"
-        r"([-+]?\d+\.?\d*[eE][-+]?\d+)",
-    ]
+    # Match against the lowercased text instead of using re.IGNORECASE
+    response_lower = response_text.lower()
 
     # Try patterns in order of specificity
-    for pattern in patterns:
-        matches = re.findall(pattern, response_text, re.IGNORECASE)
-        if matches:
+    for pattern in _NUMERIC_ANSWER_PATTERNS:
+        match = _last_group(pattern, response_lower)
+        if match is not None:
             try:
                 # Take the last match (most likely to be the final answer)
-                value = float(matches[-1])
+                value = float(match)
                 return value
             except ValueError:
                 continue
@@ -107,12 +225,11 @@ def extract_numerical_answer(response_text: str) -> Optional[float]:
     # Fallback: Look for any floating point number that might be an answer
     # This is less reliable but can catch cases where format is unusual
     # Look for numbers that appear after keywords like "answer", "result", etc.
-    fallback_pattern = r"(?:answer|result|solution|value|final)[\s\S]{0,100}?([-+]?\d+\.\d+(?:[eE][-+]?\d+)?)"
-    fallback_matches = re.findall(fallback_pattern, response_text, re.IGNORECASE)
-    if fallback_matches:
+    fallback_match = _find_number_after_keyword(response_lower)
+    if fallback_match:
         try:
             # Filter out very small numbers that might be errors or intermediate values
-            value = float(fallback_matches[-1])
+            value = float(fallback_match)
             if abs(value) > 1e-10:  # Ignore very small numbers that might be errors
                 return value
         except ValueError:
@@ -131,22 +248,16 @@ def extract_code_snippet(response_text: str) -> Optional[str]:
         Code snippet or None if not found
     """
     # Look for code blocks
-    code_block_pattern = r"```(?:python)?\s*\n(.*?)```"
-    matches = re.findall(code_block_pattern, response_text, re.DOTALL)
-    if matches:
-        return matches[-1].strip()
+    match = _last_group(_CODE_BLOCK_RE, response_text)
+    if match is not None:
+        return match.strip()
 
     # Look for inline code
-    inline_code_pattern = r"`([^`]+)`"
-    matches = re.findall(inline_code_pattern, response_text)
-    if matches:
-        # Check if it looks like Python code
-        for match in matches:
-            if any(
-                keyword in match
-                for keyword in ["import", "def", "=", "print", "return"]
-            ):
-                return match.strip()
+    for match in _INLINE_CODE_RE.finditer(response_text):
+        # Return the first span that looks like Python code
+        code = match.group(1)
+        if _PY_KEYWORD_RE.search(code):
+            return code.strip()
 
     return None
 
@@ -161,41 +272,54 @@ def extract_json_from_response(response_text: str) -> Optional[Dict[str, Any]]:
         Parsed JSON dictionary or None if not found
     """
     # Look for JSON code blocks - find the LAST one (most likely to be the final output)
-    json_block_pattern = r"```json\s*\n(.*?)```"
-    matches = re.findall(json_block_pattern, response_text, re.DOTALL)
+    match = _last_group(_JSON_BLOCK_RE, response_text)
 
-    if matches:
+    if match is not None:
         # Use the last match (most likely to be the final output)
-        json_str = matches[-1].strip()
+        json_str = match.strip()
         try:
-            json_obj = json.loads(json_str)
+            json_obj = _json_loads(json_str)
             return json_obj
         except json.JSONDecodeError:
+            if _json5_loads is not None:
+                try:
+                    return _json5_loads(json_str)
+                except ValueError:
+                    return None
             # Try to handle common issues like trailing commas or comments
             # Remove trailing commas before closing braces/brackets
-            json_str = re.sub(r",\s*}", "}", json_str)
-            json_str = re.sub(r",\s*]", "]", json_str)
+            json_str = _TRAILING_COMMA_OBJECT_RE.sub("}", json_str)
+            json_str = _TRAILING_COMMA_ARRAY_RE.sub("]", json_str)
             try:
-                json_obj = json.loads(json_str)
+                json_obj = _json_loads(json_str)
                 return json_obj
             except json.JSONDecodeError:
                 return None
 
     # Also try to find JSON objects not in code blocks (less common but possible)
     # Look for JSON-like structures: { ... } that might contain "design", "rationale", "code"
-    json_like_pattern = r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}"
-    potential_json_matches = re.findall(json_like_pattern, response_text, re.DOTALL)
-
-    for match in reversed(potential_json_matches):  # Try last first
+    # raw_decode matches braces in C and reports where each object ends
+    candidates = []
+    pos = response_text.find("{")
+    while pos >= 0:
         try:
-            json_obj = json.loads(match)
-            # Check if it looks like a Level C response (has design, rationale, or code keys)
-            if isinstance(json_obj, dict) and any(
-                key in json_obj for key in ["design", "rationale", "code"]
-            ):
-                return json_obj
+            json_obj, end = _JSON_DECODER.raw_decode(response_text, pos)
         except json.JSONDecodeError:
-            continue
+            end = None
+        # Check if it looks like a Level C response (has design, rationale, or code keys)
+        if (
+            end is not None
+            and isinstance(json_obj, dict)
+            and any(key in json_obj for key in ("design", "rationale", "code"))
+        ):
+            candidates.append(json_obj)
+            pos = response_text.find("{", end)
+        else:
+            # Not a usable object here; nested objects may still be
+            pos = response_text.find("{", pos + 1)
+
+    if candidates:
+        return candidates[-1]  # Last object is most likely the final output
 
     return None
 
@@ -230,8 +354,7 @@ def ensure_json_wrapped(
 
     # Look for text before potential JSON (explanation, reasoning, etc.)
     # Try to find where JSON-like content starts
-    json_start_pattern = r"(\{[^{}]*design[^{}]*\})"
-    match = re.search(json_start_pattern, response_text, re.DOTALL)
+    match = _JSON_DESIGN_START_RE.search(response_text)
 
     if match:
         # Found JSON-like content - preserve text before it
@@ -261,10 +384,7 @@ def extract_design_parameters(response_text: str) -> Dict[str, Any]:
 
     # Pattern 1: "parameter = value unit" or "parameter = value"
     # Examples: "width = 0.1 m", "height = 0.3 m", "length = 1.5 m"
-    param_pattern = (
-        r"(\w+)\s*=\s*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)\s*(?:m|mm|cm|kg|g|pa|mpa|hz)?"
-    )
-    matches = re.findall(param_pattern, response_text, re.IGNORECASE)
+    matches = _PARAM_EQUALS_RE.findall(response_text)
 
     for param_name, param_value in matches:
         try:
@@ -275,8 +395,7 @@ def extract_design_parameters(response_text: str) -> Dict[str, Any]:
 
     # Pattern 2: "parameter of value unit" or "parameter is value unit"
     # Examples: "height of 0.25 m", "length of 1.5 m", "width is 0.1 m"
-    param_of_pattern = r"(\w+)\s+(?:of|is)\s+([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)\s*(?:m|mm|cm|kg|g|pa|mpa|hz)?"
-    matches = re.findall(param_of_pattern, response_text, re.IGNORECASE)
+    matches = _PARAM_OF_RE.findall(response_text)
 
     for param_name, param_value in matches:
         try:
@@ -289,8 +408,7 @@ def extract_design_parameters(response_text: str) -> Dict[str, Any]:
             pass
 
     # Pattern 3: "parameter: value" format
-    param_colon_pattern = r"(\w+)\s*:\s*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)"
-    matches = re.findall(param_colon_pattern, response_text, re.IGNORECASE)
+    matches = _PARAM_COLON_RE.findall(response_text)
 
     for param_name, param_value in matches:
         try:
@@ -304,12 +422,11 @@ def extract_design_parameters(response_text: str) -> Dict[str, Any]:
 
     # Pattern 4: Look for common design parameters in natural language
     # "natural frequency of X Hz" -> frequency: X
-    freq_pattern = r"(?:natural\s+)?frequency\s+(?:of|is|:)?\s*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)\s*hz"
-    freq_matches = re.findall(freq_pattern, response_text, re.IGNORECASE)
-    if freq_matches:
+    freq_match = _last_group(_FREQUENCY_RE, response_text)
+    if freq_match is not None:
         try:
-            design["frequency"] = float(freq_matches[-1])
-            design["natural_frequency"] = float(freq_matches[-1])
+            design["frequency"] = float(freq_match)
+            design["natural_frequency"] = float(freq_match)
         except ValueError:
             pass
 
@@ -332,46 +449,130 @@ def extract_answer_from_code_result(
         Numerical value or None if not found
     """
     # Look for print statements in code
-    print_pattern = r"print\s*\([^)]*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)"
-    matches = re.findall(print_pattern, code_text)
-    if matches:
+    match = _last_group(_CODE_PRINT_RE, code_text)
+    if match is not None:
         try:
-            return float(matches[-1])
+            return float(match)
         except ValueError:
             pass
 
     # Look for return statements
-    return_pattern = r"return\s+([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)"
-    matches = re.findall(return_pattern, code_text)
-    if matches:
+    match = _last_group(_CODE_RETURN_RE, code_text)
+    if match is not None:
         try:
-            return float(matches[-1])
+            return float(match)
         except ValueError:
             pass
 
     # Look for variable assignments that might be the answer
     # e.g., "result = 123.45" or "answer = 123.45"
-    var_pattern = r"(?:result|answer|solution|value|final)\s*=\s*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)"
-    matches = re.findall(var_pattern, code_text, re.IGNORECASE)
-    if matches:
+    match = _last_group(_CODE_ASSIGN_RE, code_text)
+    if match is not None:
         try:
-            return float(matches[-1])
+            return float(match)
         except ValueError:
             pass
 
     # Look in response text for execution results
     # Pattern: "Python execution result: 123.45" or "result: 123.45"
-    exec_result_pattern = r"(?:execution\s+)?(?:result|output|value)\s*:?\s*([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)"
-    matches = re.findall(exec_result_pattern, response_text, re.IGNORECASE)
-    if matches:
+    match = _last_group(_EXEC_RESULT_RE, response_text)
+    if match is not None:
         try:
-            return float(matches[-1])
+            return float(match)
         except ValueError:
             pass
 
     return None
 
 
+def _parse_multiple_choice(
+    parsed: Dict[str, Any], response_text: str, num_options: int
+) -> None:
+    """Fill in the selected option for a multiple choice response."""
+    parsed["selected_option"] = extract_selected_option(response_text, num_options)
+    parsed["explanation"] = response_text
+
+
+def _parse_calculation(
+    parsed: Dict[str, Any], response_text: str, num_options: int
+) -> None:
+    """Fill in the numerical answer and code for a calculation response."""
+    # First try to extract answer from the response text directly
+    answer = extract_numerical_answer(response_text)
+
+    # Also try to extract code and see if answer is in code execution results
+    code = extract_code_snippet(response_text)
+    if code:
+        parsed["code"] = code
+        # Try to extract answer from code execution results
+        code_answer = extract_answer_from_code_result(code, response_text)
+        # Use code answer if we found one and didn't find a direct answer,
+        # or if code answer seems more reliable (e.g., from print/return)
+        if code_answer is not None and (answer is None or abs(code_answer) > 1e-10):
+            answer = code_answer
+
+    parsed["answer"] = answer
+    parsed["explanation"] = response_text
+
+
+def _parse_design(parsed: Dict[str, Any], response_text: str, num_options: int) -> None:
+    """Fill in design, rationale and code for a design response."""
+    # First try to extract JSON from response (preferred method)
+    json_obj = extract_json_from_response(response_text)
+
+    if json_obj:
+        # JSON found - use structured data
+        parsed["design"] = json_obj.get("design", {})
+        parsed["rationale"] = json_obj.get("rationale", "")
+        parsed["code"] = json_obj.get("code", "")
+        # Override explanation with rationale if available
+        if parsed["rationale"]:
+            parsed["explanation"] = parsed["rationale"]
+    else:
+        # Fallback to regex-based extraction
+        code = extract_code_snippet(response_text)
+        if code:
+            parsed["code"] = code
+        # Extract design parameters from text using regex patterns
+        design_params = extract_design_parameters(response_text)
+        parsed["design"] = design_params
+        parsed["rationale"] = response_text
+
+
+def _parse_multi_step_design(
+    parsed: Dict[str, Any], response_text: str, num_options: int
+) -> None:
+    """Fill in design, system metrics, rationale and code for a Level D response."""
+    # First try to extract JSON from response (preferred method)
+    json_obj = extract_json_from_response(response_text)
+
+    if json_obj:
+        # JSON found - use structured data
+        parsed["design"] = json_obj.get("design", {})
+        parsed["system_metrics"] = json_obj.get("system_metrics", {})
+        parsed["rationale"] = json_obj.get("rationale", "")
+        parsed["code"] = json_obj.get("code", "")
+    else:
+        # Fallback to regex-based extraction
+        code = extract_code_snippet(response_text)
+        if code:
+            parsed["code"] = code
+        # Extract design parameters from text using regex patterns
+        design_params = extract_design_parameters(response_text)
+        parsed["design"] = design_params
+        parsed["system_metrics"] = {}  # Can't easily extract from text
+        parsed["rationale"] = response_text
+
+
+# Task type -> parser that fills in the task-specific fields
+_PARSERS = {
+    "multiple_choice": _parse_multiple_choice,
+    "calculation": _parse_calculation,
+    "design": _parse_design,
+    "multi_step_design": _parse_multi_step_design,
+}
+
+
 def parse_response(
     response_text: str, task_type: str, num_options: int = 4
 ) -> Dict[str, Any]:
@@ -379,7 +580,8 @@ def parse_response(
 
     Args:
         response_text: The response text from the agent
-        task_type: Type of task ("multiple_choice", "calculation", "design")
+        task_type: Type of task ("multiple_choice", "calculation", "design",
+            "multi_step_design")
         num_options: Number of options for multiple choice tasks
 
     Returns:
@@ -390,71 +592,38 @@ def parse_response(
         "explanation": response_text,  # Default to full response
     }
 
-    if task_type == "multiple_choice":
-        selected_option = extract_selected_option(response_text, num_options)
-        parsed["selected_option"] = selected_option
-        parsed["explanation"] = response_text
+    parser = _PARSERS.get(task_type)
+    if parser is not None:
+        parser(parsed, response_text, num_options)
 
-    elif task_type == "calculation":
-        # First try to extract answer from the response text directly
-        answer = extract_numerical_answer(response_text)
+    return parsed
 
-        # Also try to extract code and see if answer is in code execution results
-        code = extract_code_snippet(response_text)
-        if code:
-            parsed["code"] = code
-            # Try to extract answer from code execution results
-            code_answer = extract_answer_from_code_result(code, response_text)
-            # Use code answer if we found one and didn't find a direct answer,
-            # or if code answer seems more reliable (e.g., from print/return)
-            if code_answer is not None and (answer is None or abs(code_answer) > 1e-10):
-                answer = code_answer
-
-        parsed["answer"] = answer
-        parsed["explanation"] = response_text
-
-    elif task_type == "design":
-        # First try to extract JSON from response (preferred method)
-        json_obj = extract_json_from_response(response_text)
-
-        if json_obj:
-            # JSON found - use structured data
-            parsed["design"] = json_obj.get("design", {})
-            parsed["rationale"] = json_obj.get("rationale", "")
-            parsed["code"] = json_obj.get("code", "")
-            # Override explanation with rationale if available
-            if parsed["rationale"]:
-                parsed["explanation"] = parsed["rationale"]
-        else:
-            # Fallback to regex-based extraction
-            code = extract_code_snippet(response_text)
-            if code:
-                parsed["code"] = code
-            # Extract design parameters from text using regex patterns
-            design_params = extract_design_parameters(response_text)
-            parsed["design"] = design_params
-            parsed["rationale"] = response_text
-
-    elif task_type == "multi_step_design":
-        # Level D: multi-step design task
-        # First try to extract JSON from response (preferred method)
-        json_obj = extract_json_from_response(response_text)
-
-        if json_obj:
-            # JSON found - use structured data
-            parsed["design"] = json_obj.get("design", {})
-            parsed["system_metrics"] = json_obj.get("system_metrics", {})
-            parsed["rationale"] = json_obj.get("rationale", "")
-            parsed["code"] = json_obj.get("code", "")
-        else:
-            # Fallback to regex-based extraction
-            code = extract_code_snippet(response_text)
-            if code:
-                parsed["code"] = code
-            # Extract design parameters from text using regex patterns
-            design_params = extract_design_parameters(response_text)
-            parsed["design"] = design_params
-            parsed["system_metrics"] = {}  # Can't easily extract from text
-            parsed["rationale"] = response_text
 
-    return parsed
+def parse_responses(
+    responses: List[str],
+    task_type: str,
+    num_options: int = 4,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Parse a batch of agent responses of the same task type.
+
+    Args:
+        responses: Response texts from the agent
+        task_type: Type of task shared by all responses
+        num_options: Number of options for multiple choice tasks
+        max_workers: Worker threads to spread parsing over. Parsing is regex
+            bound and CPython's re module holds the GIL, so this only helps on
+            free-threaded builds; by default responses are parsed in order.
+
+    Returns:
+        List of parsed response dictionaries, in the same order as responses
+    """
+    if not max_workers or max_workers <= 1 or len(responses) <= 1:
+        return [parse_response(text, task_type, num_options) for text in responses]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda text: parse_response(text, task_type, num_options), responses
+            )
+        )
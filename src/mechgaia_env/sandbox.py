@@ -1,29 +1,317 @@
 """Sandboxed Python execution environment for code evaluation."""
 
+import ast
+import importlib
+import multiprocessing
+import pickle
+import re
+import sys
+import threading
 import time
-from contextlib import redirect_stderr, redirect_stdout
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 from io import StringIO
-from typing import Any, Dict, Optional
+from multiprocessing.connection import Connection, wait
+from types import CodeType
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple
 
 import numpy as np
-import scipy
 
 from src.mechgaia_env.config import config
 
 
+# Variable names that look like the answer, used when no result is explicit
+_RESULT_RE = re.compile(
+    r"result|answer|solution|delta_l|delta|final|output|value", re.IGNORECASE
+)
+
+# Nodes whose bodies bind names in their own scope, not the snippet's namespace
+_NESTED_SCOPES = (
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.Lambda,
+    ast.ListComp,
+    ast.SetComp,
+    ast.DictComp,
+    ast.GeneratorExp,
+)
+
+
+def _assigned_names(tree: ast.Module) -> Tuple[str, ...]:
+    """Collect variable names assigned at module level, in source order.
+
+    Args:
+        tree: Parsed module
+
+    Returns:
+        Tuple of names in order of their first assignment
+    """
+    stores = []
+    nodes = [tree]
+    while nodes:
+        for child in ast.iter_child_nodes(nodes.pop()):
+            if isinstance(child, _NESTED_SCOPES):
+                continue
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+                stores.append(child)
+            nodes.append(child)
+    stores.sort(key=lambda node: (node.lineno, node.col_offset))
+    return tuple(dict.fromkeys(node.id for node in stores))
+
+
+@lru_cache(maxsize=512)
+def _compile_snippet(
+    source: str,
+) -> Tuple[CodeType, Optional[CodeType], Tuple[str, ...]]:
+    """Parse sandbox code once and compile it for execution.
+
+    If the last statement is a bare expression, it is split off and compiled
+    separately so its value can be returned as the result.
+
+    Args:
+        source: Python source code
+
+    Returns:
+        Tuple of (code for the statements to exec, code for the trailing
+        expression to eval or None, names assigned by the code)
+    """
+    tree = ast.parse(source, filename="<sandbox>")
+    assign_targets = _assigned_names(tree)
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        last_expr = ast.Expression(tree.body.pop().value)
+        return (
+            compile(tree, "<sandbox>", "exec"),
+            compile(last_expr, "<sandbox>", "eval"),
+            assign_targets,
+        )
+    return compile(tree, "<sandbox>", "exec"), None, assign_targets
+
+
+class _LazyModule:
+    """Stand-in for a module that is only imported on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        # Read _name directly, so a partly built instance can't recurse here
+        try:
+            name = self.__dict__["_name"]
+        except KeyError:
+            raise AttributeError(attr) from None
+        return getattr(importlib.import_module(name), attr)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        # Rebuild through __init__ when copied or unpickled
+        return _LazyModule, (self._name,)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._name}'>"
+
+
+class _ThreadRoutedStream:
+    """Stand-in for sys.stdout/sys.stderr that writes per calling thread.
+
+    redirect_stdout swaps the stream for the whole process, so executions
+    running in different threads would capture (or drop) each other's output.
+    While installed by _capture_output, this stream sends a thread's writes to
+    the buffer that thread is capturing into, and all other writes to the
+    original stream.
+    """
+
+    def __init__(self, original: TextIO):
+        self._original = original
+        self._local = threading.local()
+
+    def _target(self) -> TextIO:
+        buffer = getattr(self._local, "buffer", None)
+        return self._original if buffer is None else buffer
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._original, attr)
+
+    @contextmanager
+    def capture(self, buffer: StringIO) -> Iterator[None]:
+        """Send this thread's writes to buffer for the duration of the block."""
+        previous = getattr(self._local, "buffer", None)
+        self._local.buffer = buffer
+        try:
+            yield
+        finally:
+            self._local.buffer = previous
+
+
+# Routing streams installed while at least one local execution captures output
+_stream_lock = threading.Lock()
+_capture_count = 0
+_routed_streams: Optional[Tuple[_ThreadRoutedStream, _ThreadRoutedStream]] = None
+
+
+@contextmanager
+def _capture_output(stdout: StringIO, stderr: StringIO) -> Iterator[None]:
+    """Capture the calling thread's stdout and stderr into the given buffers.
+
+    The first of any concurrent captures swaps routing streams into sys, and
+    the last one to finish puts the original streams back, so the process-wide
+    streams are only replaced while a sandbox run is in progress.
+    """
+    global _capture_count, _routed_streams
+    with _stream_lock:
+        if _capture_count == 0:
+            _routed_streams = (
+                _ThreadRoutedStream(sys.stdout),
+                _ThreadRoutedStream(sys.stderr),
+            )
+            sys.stdout, sys.stderr = _routed_streams
+        _capture_count += 1
+        routed_stdout, routed_stderr = _routed_streams
+
+    try:
+        with routed_stdout.capture(stdout), routed_stderr.capture(stderr):
+            yield
+    finally:
+        with _stream_lock:
+            _capture_count -= 1
+            if _capture_count == 0:
+                sys.stdout = routed_stdout._original
+                sys.stderr = routed_stderr._original
+                _routed_streams = None
+
+
+# Upper bound on how long a worker may take to start a snippet. Spawning a
+# worker and importing NumPy do not count against the snippet's own timeout.
+_WORKER_START_TIMEOUT = 60.0
+
+
+class _WorkerError(Exception):
+    """Raised when a sandbox worker process dies or stops responding."""
+
+
+class _SandboxWorker:
+    """A dedicated worker process that runs one isolated execution at a time.
+
+    Each isolated executor owns its own worker, so a snippet that times out
+    only takes down that executor's process, never other executions.
+    """
+
+    def __init__(self):
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_worker_loop, args=(child_conn,), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        # Stop the process once the owning executor drops this worker
+        self._finalizer = weakref.finalize(self, self._process.kill)
+
+    def run(self, request: Tuple[Any, ...], timeout: float) -> Tuple[Any, float]:
+        """Send one execution to the worker and wait for its reply.
+
+        Args:
+            request: Arguments for _execute_in_worker
+            timeout: Seconds the execution may run once the worker starts it
+
+        Returns:
+            Tuple of (worker reply, seconds since the worker started it)
+
+        Raises:
+            pickle.PicklingError, TypeError, AttributeError: If the request
+                cannot be pickled, in which case nothing is sent
+            TimeoutError: If the execution exceeds timeout
+            _WorkerError: If the worker exits or fails to start the execution
+        """
+        self._conn.send(request)
+        try:
+            self._receive(_WORKER_START_TIMEOUT)
+        except TimeoutError as e:
+            raise _WorkerError("Sandbox worker did not start the execution") from e
+        start_ns = time.perf_counter_ns()
+        reply = self._receive(timeout)
+        return reply, (time.perf_counter_ns() - start_ns) / 1e9
+
+    def _receive(self, timeout: float) -> Any:
+        """Wait for the next message from the worker.
+
+        Raises:
+            TimeoutError: If no message arrives within timeout
+            _WorkerError: If the worker exits first
+        """
+        ready = wait([self._conn, self._process.sentinel], timeout=timeout)
+        if not ready:
+            raise TimeoutError
+        try:
+            if self._conn in ready:
+                return self._conn.recv()
+        except (EOFError, OSError):
+            pass
+        raise _WorkerError("Sandbox worker exited")
+
+    def kill(self) -> None:
+        """Stop the worker process, interrupting any running execution."""
+        self._finalizer()
+        self._process.join()
+        self._conn.close()
+
+
+def _worker_loop(conn: Connection) -> None:
+    """Serve executions sent by a _SandboxWorker until its pipe closes."""
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        conn.send(None)  # Tell the parent the execution has started
+        conn.send(_execute_in_worker(*request))
+
+
+def _picklable(value: Any) -> bool:
+    """Check whether a value can be sent between processes."""
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
 class SandboxExecutor:
     """Executes Python code in a restricted environment."""
 
-    def __init__(self, timeout: Optional[int] = None):
+    def __init__(self, timeout: Optional[int] = None, isolated: Optional[bool] = None):
         self.timeout = timeout or config.sandbox_timeout
+        # Run code in worker processes, which can be killed on timeout
+        self.isolated = config.sandbox_isolated if isolated is None else isolated
         self.safe_modules = {
             "numpy": np,
             "np": np,
-            "scipy": scipy,
+            "scipy": _LazyModule("scipy"),
             "math": __import__("math"),
         }
         # Maintain state across executions
         self.persistent_namespace = {}
+        # Reusable stdout/stderr capture buffers, one pair per thread
+        self._capture = threading.local()
+        # Worker process for isolated executions, started on first use
+        self._worker: Optional[_SandboxWorker] = None
+        self._worker_lock = threading.Lock()
+
+    def _capture_buffers(self) -> Tuple[StringIO, StringIO]:
+        """Return this thread's stdout/stderr buffers, emptied for reuse."""
+        buffers = getattr(self._capture, "buffers", None)
+        if buffers is None:
+            buffers = self._capture.buffers = (StringIO(), StringIO())
+        for buffer in buffers:
+            buffer.seek(0)
+            buffer.truncate()
+        return buffers
 
     def execute(
         self,
@@ -42,7 +330,60 @@ class SandboxExecutor:
             Dictionary with 'result', 'error', 'stdout', 'stderr' keys
         """
         timeout = timeout or self.timeout
+        if self.isolated:
+            return self._execute_isolated(code, variables, timeout)
+        return self._execute_local(code, variables, timeout)
+
+    def _execute_isolated(
+        self, code: str, variables: Optional[Dict[str, Any]], timeout: int
+    ) -> Dict[str, Any]:
+        """Execute code in a worker process, killing it if it exceeds timeout.
 
+        Persistent state is sent to the worker and the updated state is sent
+        back, so only picklable variables persist between isolated executions.
+        Isolated executions on one executor run one at a time, and the timeout
+        only starts once the worker begins running the code.
+        """
+        request = (code, variables, timeout, self.persistent_namespace)
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = _SandboxWorker()
+            try:
+                reply, elapsed = self._worker.run(request, timeout)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                # The request failed to pickle before anything was sent, so
+                # the worker is still idle and can be kept
+                return {
+                    "result": None,
+                    "error": f"Cannot send variables to sandbox worker: {e}",
+                    "stdout": "",
+                    "stderr": "",
+                    "execution_time": 0.0,
+                }
+            except TimeoutError:
+                error = f"Execution timeout after {timeout} seconds"
+                elapsed = float(timeout)
+            except _WorkerError:
+                error = "Sandbox worker process terminated unexpectedly"
+                elapsed = 0.0
+            else:
+                output, self.persistent_namespace = reply
+                return output
+            self._worker.kill()
+            self._worker = None
+
+        return {
+            "result": None,
+            "error": error,
+            "stdout": "",
+            "stderr": "",
+            "execution_time": elapsed,
+        }
+
+    def _execute_local(
+        self, code: str, variables: Optional[Dict[str, Any]], timeout: int
+    ) -> Dict[str, Any]:
+        """Execute code in this process, flagging runs that exceed timeout."""
         # Create execution namespace, starting with persistent state
         namespace = self.safe_modules.copy()
         # Add persistent namespace variables (from previous executions)
@@ -52,95 +393,52 @@ class SandboxExecutor:
             namespace.update(variables)
 
         # Capture stdout/stderr
-        stdout_capture = StringIO()
-        stderr_capture = StringIO()
+        stdout_capture, stderr_capture = self._capture_buffers()
 
         result = None
         error = None
 
-        start_time = time.time()
+        elapsed = 0.0
+        start_ns = time.perf_counter_ns()
 
         try:
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                # Execute code
-                exec(code, namespace)
+            with _capture_output(stdout_capture, stderr_capture):
+                # Execute code, evaluating a trailing expression separately
+                exec_code, last_expr_code, assign_targets = _compile_snippet(code)
+                exec(exec_code, namespace)
+                last_expr_result = None
+                if last_expr_code is not None:
+                    last_expr_result = eval(last_expr_code, namespace)
 
                 # Try to get result
                 if "result" in namespace:
                     result = namespace["result"]
                 else:
-                    # Try to evaluate the last line as an expression if it's not an assignment
-                    lines = [
-                        line.strip()
-                        for line in code.strip().split("\n")
-                        if line.strip() and not line.strip().startswith("#")
-                    ]
-                    if lines:
-                        last_line = lines[-1]
-                        # Check if last line is an expression (not an assignment statement)
-                        # Assignment would have '=' but not '==', '!=', '<=', '>='
-                        is_assignment = (
-                            "=" in last_line
-                            and "==" not in last_line
-                            and "!=" not in last_line
-                            and "<=" not in last_line
-                            and ">=" not in last_line
-                        )
-
-                        if not is_assignment and not last_line.startswith("import"):
-                            # Last line is likely an expression - try to evaluate it
-                            try:
-                                last_expr_result = eval(last_line, namespace)
-                                result = last_expr_result
-                            except (SyntaxError, NameError, TypeError, ValueError):
-                                # Last line wasn't a valid expression, will fall back to variable lookup
-                                pass
+                    # Use the value of the last line if it was an expression
+                    result = last_expr_result
 
                     # Fallback: Get last assigned variable (heuristic)
                     if result is None:
-                        # Get all variables in namespace (preserves insertion order in Python 3.7+)
-                        all_vars = list(namespace.keys())
-                        # Filter out safe modules and injected variables
-                        safe_module_keys = set(self.safe_modules.keys())
-                        injected_keys = set(variables.keys()) if variables else set()
-                        new_vars_list = [
-                            v
-                            for v in all_vars
-                            if v not in safe_module_keys and v not in injected_keys
-                        ]
-
-                        if new_vars_list:
+                        assigned = [v for v in assign_targets if v in namespace]
+
+                        if assigned:
                             # Prioritize variables that look like results (result, answer, solution, delta_l, etc.)
-                            result_keywords = [
-                                "result",
-                                "answer",
-                                "solution",
-                                "delta_l",
-                                "delta",
-                                "final",
-                                "output",
-                                "value",
-                            ]
-                            result_vars = [
-                                v
-                                for v in new_vars_list
-                                if any(kw in v.lower() for kw in result_keywords)
-                            ]
+                            result_vars = [v for v in assigned if _RESULT_RE.search(v)]
                             if result_vars:
                                 # Get the last matching variable (most recent assignment)
                                 result = namespace[result_vars[-1]]
                             else:
                                 # Get the last variable in assignment order
-                                result = namespace[new_vars_list[-1]]
+                                result = namespace[assigned[-1]]
         except Exception as e:
             error = str(e)
         finally:
-            elapsed = time.time() - start_time
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             if elapsed > timeout:
                 error = f"Execution timeout after {timeout} seconds"
 
             # Update persistent namespace with all new/modified variables (except safe modules)
-            if not error and "namespace" in locals():
+            if not error:
                 # Save all variables that were created/modified in this execution
                 for key, value in namespace.items():
                     if key not in self.safe_modules:
@@ -151,5 +449,35 @@ class SandboxExecutor:
             "error": error,
             "stdout": stdout_capture.getvalue(),
             "stderr": stderr_capture.getvalue(),
-            "execution_time": elapsed if "elapsed" in locals() else 0,
+            "execution_time": elapsed,
         }
+
+
+def _execute_in_worker(
+    code: str,
+    variables: Optional[Dict[str, Any]],
+    timeout: int,
+    persistent_namespace: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run one isolated execution inside a worker process.
+
+    Args:
+        code: Python code to execute
+        variables: Dictionary of variables to inject into execution context
+        timeout: Execution timeout in seconds
+        persistent_namespace: State carried over from previous executions
+
+    Returns:
+        Tuple of (execution output, picklable persistent state)
+    """
+    executor = SandboxExecutor(timeout=timeout, isolated=False)
+    executor.persistent_namespace = persistent_namespace
+    output = executor.execute(code, variables=variables)
+    if not _picklable(output["result"]):
+        output["result"] = repr(output["result"])
+    state = {
+        key: value
+        for key, value in executor.persistent_namespace.items()
+        if not key.startswith("__") and _picklable(value)
+    }
+    return output, state
@@ -1,72 +1,199 @@
 """Statistical analysis for benchmark results."""
 
-import json
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 import numpy as np
 
 from src.mechgaia_env.config import config
+from src.mechgaia_env.database import _json_dumps, _json_loads
+
+
+# Shared generator for bootstrap draws, created and seeded once per process
+_rng = np.random.Generator(np.random.PCG64DXSM(config.bootstrap_seed))
+
+# Upper bound on resampled elements held in memory at once by _bootstrap_means
+_BOOTSTRAP_CHUNK_ELEMENTS = 1_000_000
+
+# Write buffer for JSONL reports, so large batches flush in few syscalls
+_REPORT_BUFFER_SIZE = 1 << 16
+
+
+def _bootstrap_means(scores_array: np.ndarray, n_iterations: int) -> np.ndarray:
+    """Draw bootstrap resamples of the scores and return their means.
+
+    Scores are usually drawn from a few distinct values (e.g. 0/1 correctness).
+    In that case each resample is drawn as multinomial counts over the distinct
+    values, which has the same distribution as resampling individual scores but
+    only needs one column per distinct value. Otherwise resample indices are
+    drawn as (chunk, n) matrices. Either way the work is chunked so the working
+    set stays bounded for long score lists. The gathered resamples use int32
+    indices and float32 scores (ample for scores in [0, 1]) to halve memory
+    traffic, while means are still accumulated in float64.
+
+    Args:
+        scores_array: Array of scores to resample
+        n_iterations: Number of bootstrap iterations
+
+    Returns:
+        Array of n_iterations resample means
+    """
+    n = len(scores_array)
+    values, counts = np.unique(scores_array, return_counts=True)
+    use_counts = 2 * len(values) <= n
+    width = len(values) if use_counts else n
+    chunk = max(1, _BOOTSTRAP_CHUNK_ELEMENTS // max(width, 1))
+    if not use_counts:
+        scores_f32 = scores_array.astype(np.float32)
+
+    bootstrap_means = np.empty(n_iterations)
+    for start in range(0, n_iterations, chunk):
+        stop = min(start + chunk, n_iterations)
+        if use_counts:
+            resampled_counts = _rng.multinomial(n, counts / n, size=stop - start)
+            bootstrap_means[start:stop] = resampled_counts @ values / n
+        else:
+            indices = _rng.integers(0, n, size=(stop - start, n), dtype=np.int32)
+            bootstrap_means[start:stop] = scores_f32[indices].mean(
+                axis=1, dtype=np.float64
+            )
+
+    return bootstrap_means
+
+
+@lru_cache(maxsize=128)
+def _cached_bootstrap_means(scores_bytes: bytes, n_iterations: int) -> np.ndarray:
+    """Memoized _bootstrap_means keyed by the raw float64 score buffer."""
+    bootstrap_means = _bootstrap_means(np.frombuffer(scores_bytes), n_iterations)
+    bootstrap_means.flags.writeable = False
+    return bootstrap_means
+
+
+def _shared_bootstrap_means(scores_array: np.ndarray, n_iterations: int) -> np.ndarray:
+    """Return bootstrap means for scores, reusing draws for identical inputs.
+
+    The confidence interval and significance test both resample the same score
+    lists within a report, so a list's bootstrap distribution is computed once
+    and shared. Two samples compared against each other must not both come
+    from here, or identical lists would get identical draws. The returned
+    array is read-only.
+
+    Args:
+        scores_array: Array of scores to resample
+        n_iterations: Number of bootstrap iterations
+
+    Returns:
+        Read-only array of bootstrap means
+    """
+    scores_bytes = np.ascontiguousarray(scores_array, dtype=float).tobytes()
+    return _cached_bootstrap_means(scores_bytes, n_iterations)
+
+
+def _two_percentiles(
+    values: np.ndarray, q_lower: float, q_upper: float
+) -> Tuple[float, float]:
+    """Compute two percentiles with a single partial sort.
+
+    Matches np.percentile's default linear interpolation, but uses
+    np.partition to place only the neighbouring order statistics instead of
+    sorting the whole array.
+
+    Args:
+        values: 1-D array of values
+        q_lower: Lower percentile in [0, 100]
+        q_upper: Upper percentile in [0, 100]
+
+    Returns:
+        Tuple of (lower percentile, upper percentile)
+    """
+    positions = np.array([q_lower, q_upper]) / 100 * (values.size - 1)
+    below = np.floor(positions).astype(int)
+    above = np.ceil(positions).astype(int)
+    partitioned = np.partition(values, np.unique(np.concatenate([below, above])))
+    weights = positions - below
+    lower, upper = partitioned[below] + weights * (
+        partitioned[above] - partitioned[below]
+    )
+    return lower, upper
 
 
 def bootstrap_confidence_interval(
-    scores: List[float], confidence_level: float = 0.95, n_iterations: int = 1000
+    scores: Union[List[float], np.ndarray],
+    confidence_level: float = 0.95,
+    n_iterations: int = 1000,
 ) -> Tuple[float, float, float]:
     """Compute bootstrap confidence interval for scores.
 
     Args:
-        scores: List of scores
+        scores: List or array of scores
         confidence_level: Confidence level (default 0.95)
         n_iterations: Number of bootstrap iterations
 
     Returns:
         Tuple of (mean, lower_bound, upper_bound)
     """
-    if not scores:
+    if len(scores) == 0:
         return 0.0, 0.0, 0.0
 
-    scores_array = np.array(scores)
+    scores_array = np.asarray(scores, dtype=float)
     mean = np.mean(scores_array)
 
-    # Bootstrap sampling
-    bootstrap_means = []
-    n = len(scores)
+    bootstrap_means = _shared_bootstrap_means(scores_array, n_iterations)
 
-    for _ in range(n_iterations):
-        sample = np.random.choice(scores_array, size=n, replace=True)
-        bootstrap_means.append(np.mean(sample))
-
-    bootstrap_means = np.array(bootstrap_means)
-
-    # Calculate percentiles
+    # Select both percentiles with one partition
     alpha = 1 - confidence_level
-    lower = np.percentile(bootstrap_means, 100 * alpha / 2)
-    upper = np.percentile(bootstrap_means, 100 * (1 - alpha / 2))
+    lower, upper = _two_percentiles(
+        bootstrap_means, 100 * alpha / 2, 100 * (1 - alpha / 2)
+    )
 
     return mean, lower, upper
 
 
-def aggregate_scores(
-    evaluations: List[Dict[str, Any]], score_key: str = "correctness"
-) -> Dict[str, Any]:
-    """Aggregate scores from multiple evaluations.
+def build_score_arrays(
+    evaluations: List[Dict[str, Any]], keys: Iterable[str]
+) -> Dict[str, np.ndarray]:
+    """Extract several score keys from evaluations in a single pass.
 
     Args:
         evaluations: List of evaluation dictionaries
-        score_key: Key to extract score from each evaluation
+        keys: Score keys to extract from each evaluation
 
     Returns:
-        Dictionary with aggregated statistics
+        Dictionary mapping each key to a float array of its non-missing scores
     """
-    scores = []
+    columns: Dict[str, List[float]] = {key: [] for key in keys}
     for eval_dict in evaluations:
         scores_dict = eval_dict.get("scores", {})
         if isinstance(scores_dict, str):
-            scores_dict = json.loads(scores_dict)
-        score = scores_dict.get(score_key)
-        if score is not None:
-            scores.append(float(score))
+            scores_dict = _json_loads(scores_dict)
+        for key, column in columns.items():
+            score = scores_dict.get(key)
+            if score is not None:
+                column.append(float(score))
+
+    return {key: np.array(column, dtype=float) for key, column in columns.items()}
+
+
+def aggregate_scores(
+    evaluations: Union[List[Dict[str, Any]], np.ndarray],
+    score_key: str = "correctness",
+) -> Dict[str, Any]:
+    """Aggregate scores from multiple evaluations.
+
+    Args:
+        evaluations: List of evaluation dictionaries, or an array of scores
+            already extracted with build_score_arrays
+        score_key: Key to extract score from each evaluation (ignored for arrays)
+
+    Returns:
+        Dictionary with aggregated statistics
+    """
+    if isinstance(evaluations, np.ndarray):
+        scores = evaluations
+    else:
+        scores = build_score_arrays(evaluations, [score_key])[score_key]
 
-    if not scores:
+    if scores.size == 0:
         return {"mean": 0.0, "std": 0.0, "n": 0, "ci_lower": 0.0, "ci_upper": 0.0}
 
     mean, ci_lower, ci_upper = bootstrap_confidence_interval(
@@ -86,6 +213,38 @@ def aggregate_scores(
     }
 
 
+def aggregate_scores_batch(
+    evaluations: List[Dict[str, Any]],
+    score_keys: Iterable[str],
+    group_key: str = "model_name",
+) -> Dict[Tuple[Any, str], Dict[str, Any]]:
+    """Aggregate several score keys for every group of evaluations.
+
+    Evaluations are grouped and their scores parsed in a single pass, instead
+    of rescanning the full list for each (group, score key) pair.
+
+    Args:
+        evaluations: List of evaluation dictionaries
+        score_keys: Score keys to aggregate
+        group_key: Evaluation field to group by (e.g. model_name)
+
+    Returns:
+        Dictionary mapping (group, score_key) to aggregated statistics
+    """
+    score_keys = list(score_keys)
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for eval_dict in evaluations:
+        groups.setdefault(eval_dict.get(group_key), []).append(eval_dict)
+
+    results = {}
+    for group, group_evaluations in groups.items():
+        score_arrays = build_score_arrays(group_evaluations, score_keys)
+        for score_key, scores in score_arrays.items():
+            results[(group, score_key)] = aggregate_scores(scores)
+
+    return results
+
+
 def statistical_significance_test(
     scores1: List[float], scores2: List[float], alpha: float = 0.05
 ) -> Dict[str, Any]:
@@ -110,22 +269,19 @@ def statistical_significance_test(
             "ci_upper": 0.0,
         }
 
-    # Bootstrap difference distribution
+    # Bootstrap difference distribution. The first sample reuses the draws of
+    # its confidence interval; the second is always drawn fresh, so the two are
+    # independent even when the score lists are identical.
     n_iterations = config.bootstrap_iterations
-    differences = []
-
-    for _ in range(n_iterations):
-        sample1 = np.random.choice(scores1, size=len(scores1), replace=True)
-        sample2 = np.random.choice(scores2, size=len(scores2), replace=True)
-        diff = np.mean(sample1) - np.mean(sample2)
-        differences.append(diff)
-
-    differences = np.array(differences)
+    means1 = _shared_bootstrap_means(np.asarray(scores1, dtype=float), n_iterations)
+    means2 = _bootstrap_means(np.asarray(scores2, dtype=float), n_iterations)
+    differences = means1 - means2
     mean_diff = np.mean(differences)
 
     # Calculate confidence interval
-    ci_lower = np.percentile(differences, 100 * alpha / 2)
-    ci_upper = np.percentile(differences, 100 * (1 - alpha / 2))
+    ci_lower, ci_upper = _two_percentiles(
+        differences, 100 * alpha / 2, 100 * (1 - alpha / 2)
+    )
 
     # Significance: CI does not contain zero
     significant = not (ci_lower <= 0 <= ci_upper)
@@ -152,7 +308,7 @@ def generate_jsonl_report(evaluations: List[Dict[str, Any]], output_path: str):
         evaluations: List of evaluation dictionaries
         output_path: Path to output JSONL file
     """
-    with open(output_path, "w") as f:
+    with open(output_path, "w", encoding="utf-8", buffering=_REPORT_BUFFER_SIZE) as f:
         for eval_dict in evaluations:
             # Flatten evaluation for JSONL
             record = {
@@ -161,4 +317,5 @@ def generate_jsonl_report(evaluations: List[Dict[str, Any]], output_path: str):
                 "scores": eval_dict.get("scores", {}),
                 "timestamp": eval_dict.get("timestamp"),
             }
-            f.write(json.dumps(record) + "\n")
+            f.write(_json_dumps(record))
+            f.write("\n")
@@ -1,21 +1,262 @@
 """Engineering toolbox with material database, math engine, and plotting."""
 
+import ast
+import importlib.util
 import json
+import threading
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import sympy as sp
+from sympy.polys.polyerrors import PolynomialError
 
 from src.mechgaia_env.config import config
 
-try:
-    import matplotlib.pyplot as plt
-
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    plt = None
+# matplotlib is only imported by the first plot, since most toolbox users
+# (material lookups, formula evaluation) never draw anything
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+
+
+@cache
+def _figure_class() -> Any:
+    """Import matplotlib's Figure class on first use.
+
+    Figures are created directly rather than through pyplot, so they are not
+    tracked by pyplot's global figure manager and need no GUI backend to be
+    saved to files.
+    """
+    from matplotlib.figure import Figure
+
+    return Figure
+
+
+# Names available to formulas, built once and shared by every evaluation
+_FORMULA_GLOBALS = {
+    "__builtins__": {},
+    "np": np,
+    "numpy": np,
+    "sqrt": np.sqrt,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "exp": np.exp,
+    "log": np.log,
+    "pi": np.pi,
+    "e": np.e,
+}
+
+
+# NumPy functions formulas may call besides ufuncs (np.sqrt, np.abs, ...)
+_NUMPY_FUNCTIONS = frozenset(
+    {"sum", "prod", "mean", "max", "min", "clip", "where", "round", "hypot"}
+)
+
+# Expression nodes formulas may contain; attributes and names are checked apart
+_FORMULA_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.BoolOp,
+    ast.IfExp,
+    ast.Call,
+    ast.keyword,
+    ast.Constant,
+    ast.Tuple,
+    ast.List,
+    ast.Subscript,
+    ast.Slice,
+    ast.Load,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+    ast.boolop,
+)
+
+
+def _is_numpy_member(node: ast.Attribute) -> bool:
+    """Check whether an attribute node is a whitelisted NumPy function or constant."""
+    if not (isinstance(node.value, ast.Name) and node.value.id in ("np", "numpy")):
+        return False
+    if node.attr.startswith("_"):
+        return False
+    member = getattr(np, node.attr, None)
+    return isinstance(member, (np.ufunc, float)) or node.attr in _NUMPY_FUNCTIONS
+
+
+def _check_formula(tree: ast.Expression) -> None:
+    """Reject formulas that use anything beyond arithmetic and math functions.
+
+    Attribute access is limited to NumPy ufuncs, constants and _NUMPY_FUNCTIONS,
+    so formulas cannot reach modules, files or dunder attributes through np.
+
+    Args:
+        tree: Parsed formula
+
+    Raises:
+        ValueError: If the formula uses an unsupported construct
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute):
+            allowed = _is_numpy_member(node)
+        elif isinstance(node, ast.Name):
+            allowed = not node.id.startswith("_")
+        else:
+            allowed = isinstance(node, _FORMULA_NODES)
+        if not allowed:
+            raise ValueError(f"Unsupported formula expression: {ast.unparse(node)}")
+
+
+@lru_cache(maxsize=512)
+def _compile_formula(formula: str) -> CodeType:
+    """Parse, check and compile a formula string once for repeated evaluation.
+
+    Raises:
+        SyntaxError: If the formula is not a valid Python expression
+        ValueError: If the formula uses an unsupported construct
+    """
+    tree = ast.parse(formula, mode="eval")
+    _check_formula(tree)
+    return compile(tree, "<formula>", "eval")
+
+
+# NumPy functions besides ufuncs that map each element to one output element
+_ELEMENTWISE_FUNCTIONS = (np.clip, np.where, np.round)
+
+# Nodes that act element by element when their operands are arrays
+_ELEMENTWISE_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Name,
+    ast.Attribute,
+    ast.keyword,
+    ast.Load,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+)
+
+
+def _resolve_formula_function(node: ast.expr) -> Any:
+    """Look up the object a formula call refers to, or None if unknown."""
+    if isinstance(node, ast.Name):
+        return _FORMULA_GLOBALS.get(node.id)
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        return getattr(np, node.attr, None)
+    return None
+
+
+@lru_cache(maxsize=512)
+def _is_elementwise(formula: str) -> bool:
+    """Check whether a formula gives the same result on arrays as per element.
+
+    Reductions (np.max, np.sum, ...), conditionals, boolean operators, chained
+    comparisons and subscripts behave differently on whole arrays, so formulas
+    using them are not elementwise.
+    """
+    for node in ast.walk(ast.parse(formula, mode="eval")):
+        if isinstance(node, ast.Call):
+            function = _resolve_formula_function(node.func)
+            if not (
+                isinstance(function, np.ufunc)
+                or any(function is f for f in _ELEMENTWISE_FUNCTIONS)
+            ):
+                return False
+        elif isinstance(node, ast.Compare):
+            if len(node.ops) > 1:
+                return False
+        elif not isinstance(node, _ELEMENTWISE_NODES):
+            return False
+    return True
+
+
+# Polynomials up to this degree with numeric coefficients are solved by np.roots
+_NUMERIC_ROOTS_MAX_DEGREE = 4
+
+# Relative size of an imaginary part below which np.roots output counts as real
+_REAL_ROOT_TOLERANCE = 1e-9
+
+
+def _numeric_polynomial_roots(expr: sp.Expr, symbol: sp.Symbol) -> Optional[tuple]:
+    """Solve a low-degree polynomial with numeric coefficients using np.roots.
+
+    Float coefficients are made exact the way sp.solve does, and repeated
+    factors are divided out first, so each root is found once and accurately.
+    Roots are returned as SymPy floats (plus an imaginary part for complex
+    roots), ordered real roots first, like sp.solve.
+
+    Args:
+        expr: Expression equal to zero
+        symbol: Symbol to solve for
+
+    Returns:
+        Tuple of roots, or None if the expression is not such a polynomial
+    """
+    try:
+        poly = sp.Poly(expr, symbol)
+    except PolynomialError:
+        return None
+    if not 1 <= poly.degree() <= _NUMERIC_ROOTS_MAX_DEGREE or not all(
+        coeff.is_Number for coeff in poly.all_coeffs()
+    ):
+        return None
+    if not poly.domain.is_Exact:
+        # Like sp.solve, treat float coefficients as the rationals they print as
+        poly = sp.Poly(
+            [sp.nsimplify(coeff, rational=True) for coeff in poly.all_coeffs()],
+            symbol,
+        )
+    poly = poly.sqf_part()
+
+    roots = np.roots(np.array(poly.all_coeffs(), dtype=np.float64))
+    is_real = np.abs(roots.imag) <= _REAL_ROOT_TOLERANCE * np.maximum(1.0, abs(roots))
+    roots = [
+        complex(root.real, 0.0) if real else complex(root)
+        for root, real in zip(roots, is_real)
+    ]
+    roots.sort(key=lambda root: (root.imag != 0, root.real, root.imag))
+    return tuple(
+        sp.Float(root.real) + sp.Float(root.imag) * sp.I
+        if root.imag
+        else sp.Float(root.real)
+        for root in roots
+    )
+
+
+@lru_cache(maxsize=256)
+def _solve_equation(equation: str, variable: str) -> tuple:
+    """Parse and solve an equation once per (equation, variable) pair."""
+    expr = sp.sympify(equation)
+    symbol = sp.Symbol(variable)
+    roots = _numeric_polynomial_roots(expr, symbol)
+    if roots is not None:
+        return roots
+    return tuple(sp.solve(expr, symbol))
+
+
+@lru_cache(maxsize=8)
+def _read_materials_file(path: str, mtime_ns: int) -> Dict[str, Dict[str, Any]]:
+    """Parse a materials JSON file with case-folded names.
+
+    Cached per path and modification time, so databases share one parse until
+    the file changes. The result is shared between callers and must not be
+    mutated; MaterialDatabase copies it before use.
+    """
+    with open(path, "r") as f:
+        raw = json.load(f)
+    return {name.lower(): properties for name, properties in raw.items()}
+
+
+def _as_float(value: Any) -> float:
+    """Convert a numeric property to float, using NaN for anything else."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return np.nan
 
 
 class MaterialDatabase:
@@ -24,18 +265,45 @@ class MaterialDatabase:
     def __init__(self, materials_file: Optional[Path] = None):
         self.materials_file = materials_file or config.materials_file
         self.materials = self._load_materials()
+        self._cols = self._build_columns()
 
     def _load_materials(self) -> Dict[str, Dict[str, Any]]:
-        """Load materials from JSON file."""
+        """Load materials from JSON file, keyed by lower-case name."""
         if self.materials_file.exists():
             try:
-                with open(self.materials_file, "r") as f:
-                    return json.load(f)
+                mtime_ns = self.materials_file.stat().st_mtime_ns
+                materials = _read_materials_file(str(self.materials_file), mtime_ns)
+                # Copy the mapping and each material's (flat) properties, so
+                # changes made through one database never reach the cached
+                # parse or other databases
+                return {name: dict(props) for name, props in materials.items()}
             except Exception:
                 return self._default_materials()
         else:
             return self._default_materials()
 
+    def _build_columns(self) -> Dict[str, np.ndarray]:
+        """Arrange numeric material properties as one float64 array each.
+
+        Materials missing a property (or with a non-numeric value) get NaN,
+        so they never match a range filter on that property.
+        """
+        props = list(self.materials.values())
+        keys = {
+            key
+            for material in props
+            for key, value in material.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+        columns = {"name": np.array(list(self.materials), dtype=object)}
+        for key in sorted(keys):
+            columns[key] = np.fromiter(
+                (_as_float(material.get(key)) for material in props),
+                dtype=np.float64,
+                count=len(props),
+            )
+        return columns
+
     def _default_materials(self) -> Dict[str, Dict[str, Any]]:
         """Default material properties."""
         return {
@@ -97,6 +365,35 @@ class MaterialDatabase:
         """List all available materials."""
         return list(self.materials.keys())
 
+    def filter_materials(
+        self, **ranges: Tuple[Optional[float], Optional[float]]
+    ) -> List[str]:
+        """Find materials whose properties fall within the given ranges.
+
+        Example: ``filter_materials(yield_strength=(300e6, None))`` lists all
+        materials with a yield strength of at least 300 MPa.
+
+        Args:
+            **ranges: Property name mapped to an inclusive (low, high) range;
+                either bound may be None to leave that side open
+
+        Returns:
+            Lower-case names of matching materials
+
+        Raises:
+            ValueError: If a property is not a numeric material property
+        """
+        mask = np.ones(len(self._cols["name"]), dtype=bool)
+        for prop, (low, high) in ranges.items():
+            column = self._cols.get(prop)
+            if column is None or prop == "name":
+                raise ValueError(f"Unknown numeric material property: {prop}")
+            if low is not None:
+                mask &= column >= low
+            if high is not None:
+                mask &= column <= high
+        return self._cols["name"][mask].tolist()
+
 
 class MathEngine:
     """Mathematical computation engine using NumPy and SymPy."""
@@ -113,27 +410,70 @@ class MathEngine:
 
         Returns:
             Computed result
+
+        Raises:
+            ValueError: If the formula uses anything beyond arithmetic and
+                NumPy math functions
         """
-        safe_dict = {
-            "__builtins__": {},
-            "np": np,
-            "numpy": np,
-            "sqrt": np.sqrt,
-            "sin": np.sin,
-            "cos": np.cos,
-            "tan": np.tan,
-            "exp": np.exp,
-            "log": np.log,
-            "pi": np.pi,
-            "e": np.e,
-            **variables,
-        }
+        # Variables are passed as locals, so they shadow the shared names
+        return eval(_compile_formula(formula), _FORMULA_GLOBALS, dict(variables))
+
+    def evaluate_formula_batch(
+        self, formula: str, variables: Dict[str, Any]
+    ) -> np.ndarray:
+        """Evaluate a formula over arrays of variable values.
+
+        Elementwise formulas are evaluated once on the whole arrays. Formulas
+        with reductions or conditionals (e.g. ``np.max(F)`` or
+        ``a if a > b else b``) are evaluated per element instead, so every
+        result matches evaluate_formula on that element's values.
+
+        Args:
+            formula: Formula string (Python-compatible)
+            variables: Dictionary mapping variable names to arrays (or scalars)
+                of values, broadcast against each other
+
+        Returns:
+            Array of results with the broadcast shape of the inputs
 
-        return eval(formula, safe_dict)
+        Raises:
+            ValueError: If the formula uses an unsupported construct or gives
+                one value per element in a different shape than the inputs
+        """
+        code = _compile_formula(formula)
+        names = list(variables)
+        arrays = np.broadcast_arrays(
+            *(np.asarray(variables[name], dtype=np.float64) for name in names)
+        )
+        shape = arrays[0].shape if arrays else ()
+
+        if not _is_elementwise(formula):
+            result = np.empty(shape)
+            for index in np.ndindex(shape):
+                values = {name: array[index] for name, array in zip(names, arrays)}
+                result[index] = self.evaluate_formula(formula, values)
+            return result
+
+        result = np.asarray(
+            eval(code, _FORMULA_GLOBALS, dict(zip(names, arrays))), dtype=np.float64
+        )
+        if result.shape == shape:
+            return result
+        # An elementwise formula that ignores its inputs gives the same value
+        # for every element
+        if result.ndim == 0:
+            return np.full(shape, result)
+        raise ValueError(
+            f"Formula result has shape {result.shape}, expected {shape}: {formula}"
+        )
 
     def symbolic_solve(self, equation: str, variable: str) -> Any:
         """Solve equation symbolically.
 
+        Polynomials of degree up to 4 with numeric coefficients are solved
+        numerically, giving floating-point roots; other equations are solved
+        exactly with sp.solve.
+
         Args:
             equation: Equation string
             variable: Variable to solve for
@@ -141,16 +481,35 @@ class MathEngine:
         Returns:
             SymPy solution
         """
-        x = sp.Symbol(variable)
-        eq = sp.sympify(equation)
-        return sp.solve(eq, x)
+        # Solutions are immutable SymPy expressions; only the list is copied
+        return list(_solve_equation(equation, variable))
 
 
 class PlottingBackend:
     """Plotting backend for engineering diagrams."""
 
     def __init__(self):
-        pass
+        # One reusable (figure, axes) per diagram type, cleared between plots
+        self._figures: Dict[str, Tuple[Any, Any]] = {}
+        # Figures are shared state, so only one plot is drawn at a time
+        self._lock = threading.Lock()
+
+    def _axes(self, diagram_type: str, figsize: Tuple[float, float]) -> Tuple[Any, Any]:
+        """Return the cleared figure and axes for a diagram type.
+
+        Args:
+            diagram_type: Key identifying the diagram
+            figsize: Figure size in inches, used when the figure is created
+
+        Returns:
+            Tuple of (figure, axes)
+        """
+        if diagram_type not in self._figures:
+            fig = _figure_class()(figsize=figsize)
+            self._figures[diagram_type] = (fig, fig.add_subplot())
+        fig, ax = self._figures[diagram_type]
+        ax.cla()
+        return fig, ax
 
     def plot_stress_strain(
         self,
@@ -173,33 +532,36 @@ class PlottingBackend:
         if not MATPLOTLIB_AVAILABLE:
             return {"error": "matplotlib not available"}
 
-        fig, ax = plt.subplots(figsize=(8, 6))
-        ax.plot(strain, stress, "b-", linewidth=2)
+        # Convert once; matplotlib and the validation reuse the same arrays
+        stress = np.ascontiguousarray(stress, dtype=np.float64)
+        strain = np.ascontiguousarray(strain, dtype=np.float64)
 
-        if yield_point:
-            ax.axhline(
-                y=yield_point,
-                color="r",
-                linestyle="--",
-                label=f"Yield Strength: {yield_point / 1e6:.1f} MPa",
-            )
+        with self._lock:
+            fig, ax = self._axes("stress_strain", (8, 6))
+            ax.plot(strain, stress, "b-", linewidth=2)
 
-        ax.set_xlabel("Strain", fontsize=12)
-        ax.set_ylabel("Stress (Pa)", fontsize=12)
-        ax.set_title("Stress-Strain Curve", fontsize=14)
-        ax.grid(True, alpha=0.3)
-        ax.legend()
+            if yield_point:
+                ax.axhline(
+                    y=yield_point,
+                    color="r",
+                    linestyle="--",
+                    label=f"Yield Strength: {yield_point / 1e6:.1f} MPa",
+                )
 
-        if output_path:
-            plt.savefig(output_path, dpi=150, bbox_inches="tight")
+            ax.set_xlabel("Strain", fontsize=12)
+            ax.set_ylabel("Stress (Pa)", fontsize=12)
+            ax.set_title("Stress-Strain Curve", fontsize=14)
+            ax.grid(True, alpha=0.3)
+            ax.legend()
 
-        plt.close()
+            if output_path:
+                fig.savefig(output_path, dpi=150, bbox_inches="tight")
 
         # Validation
         validation = {
             "has_labels": True,
             "has_yield_point": yield_point is not None,
-            "data_points": len(stress),
+            "data_points": stress.size,
         }
 
         return validation
@@ -223,26 +585,29 @@ class PlottingBackend:
         if not MATPLOTLIB_AVAILABLE:
             return {"error": "matplotlib not available"}
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.plot(positions, moments, "g-", linewidth=2)
-        ax.fill_between(positions, moments, alpha=0.3)
-        ax.axhline(y=0, color="k", linestyle="-", linewidth=0.5)
+        # Convert once; plot and fill_between would each convert lists again
+        positions = np.ascontiguousarray(positions, dtype=np.float64)
+        moments = np.ascontiguousarray(moments, dtype=np.float64)
 
-        ax.set_xlabel("Position (m)", fontsize=12)
-        ax.set_ylabel("Bending Moment (N⋅m)", fontsize=12)
-        ax.set_title("Bending Moment Diagram", fontsize=14)
-        ax.grid(True, alpha=0.3)
+        with self._lock:
+            fig, ax = self._axes("bending_moment", (10, 6))
+            ax.plot(positions, moments, "g-", linewidth=2)
+            ax.fill_between(positions, moments, alpha=0.3)
+            ax.axhline(y=0, color="k", linestyle="-", linewidth=0.5)
 
-        if output_path:
-            plt.savefig(output_path, dpi=150, bbox_inches="tight")
+            ax.set_xlabel("Position (m)", fontsize=12)
+            ax.set_ylabel("Bending Moment (N⋅m)", fontsize=12)
+            ax.set_title("Bending Moment Diagram", fontsize=14)
+            ax.grid(True, alpha=0.3)
 
-        plt.close()
+            if output_path:
+                fig.savefig(output_path, dpi=150, bbox_inches="tight")
 
         # Validation
         validation = {
             "has_labels": True,
             "has_zero_line": True,
-            "data_points": len(moments),
+            "data_points": moments.size,
         }
 
         return validation
@@ -262,12 +627,11 @@ class PlottingBackend:
         validation = {}
 
         if diagram_type == "stress_strain":
+            stress = np.asarray(data.get("stress", []), dtype=np.float64)
             validation["has_stress"] = "stress" in data
             validation["has_strain"] = "strain" in data
-            validation["lengths_match"] = len(data.get("stress", [])) == len(
-                data.get("strain", [])
-            )
-            validation["positive_stress"] = all(s >= 0 for s in data.get("stress", []))
+            validation["lengths_match"] = stress.size == len(data.get("strain", []))
+            validation["positive_stress"] = bool(stress.size == 0 or stress.min() >= 0)
 
         elif diagram_type == "bending_moment":
             validation["has_positions"] = "positions" in data
@@ -295,6 +659,12 @@ class EngineeringToolbox:
         """Evaluate mathematical formula."""
         return self.math.evaluate_formula(formula, variables)
 
+    def evaluate_formula_batch(
+        self, formula: str, variables: Dict[str, Any]
+    ) -> np.ndarray:
+        """Evaluate mathematical formula over arrays of variable values."""
+        return self.math.evaluate_formula_batch(formula, variables)
+
     def plot_stress_strain(
         self,
         stress: List[float],
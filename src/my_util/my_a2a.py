@@ -1,10 +1,12 @@
 import asyncio
-import uuid
+import secrets
+import weakref
 
 import httpx
 from a2a.client import A2ACardResolver, A2AClient
 from a2a.types import (
     AgentCard,
+    JSONRPCErrorResponse,
     Message,
     MessageSendParams,
     Part,
@@ -16,21 +18,45 @@ from a2a.types import (
 
 from src.mechgaia_env.config import config
 
+# One pooled HTTP client per event loop, reused by every A2A call on that loop
+_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Agent cards already resolved by send_message, keyed by base URL. An entry is
+# dropped when a send to that URL fails, so a restarted or replaced agent has
+# its card fetched again on the next message.
+_agent_cards: dict[str, AgentCard] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for the running event loop.
+
+    Reusing one client keeps connections alive between requests instead of
+    opening (and leaking) a new connection pool per call. Clients are bound to
+    the loop they were created on, so each loop gets its own.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        # Separate values for connect, read, write, and pool; use longer
+        # timeouts for agent operations that may take time to process
+        timeout = httpx.Timeout(
+            connect=config.a2a_connect_timeout,
+            read=config.a2a_timeout,
+            write=config.a2a_timeout,
+            pool=config.a2a_connect_timeout,
+        )
+        client = _clients[loop] = httpx.AsyncClient(
+            timeout=timeout, limits=httpx.Limits(max_keepalive_connections=32)
+        )
+    return client
+
 
 async def get_agent_card(url: str) -> AgentCard | None:
-    # Configure timeout for agent card retrieval
     # Strip trailing slashes to prevent double slashes when A2ACardResolver adds paths
     # Note: /to_agent/<agent-id> path handling is done by earthshaker/controller
     # We preserve the full URL as-is (including /to_agent/ paths) and just remove trailing slashes
     url = url.rstrip("/")
-    timeout = httpx.Timeout(
-        connect=config.a2a_connect_timeout,
-        read=config.a2a_timeout,
-        write=config.a2a_timeout,
-        pool=config.a2a_connect_timeout,
-    )
-    httpx_client = httpx.AsyncClient(timeout=timeout)
-    resolver = A2ACardResolver(httpx_client=httpx_client, base_url=url)
+    resolver = A2ACardResolver(httpx_client=_get_client(), base_url=url)
 
     card: AgentCard | None = await resolver.get_agent_card()
 
@@ -39,39 +65,47 @@ async def get_agent_card(url: str) -> AgentCard | None:
 
 async def wait_agent_ready(url, timeout=10):
     # wait until the A2A server is ready, check by getting the agent card
-    retry_cnt = 0
-    while retry_cnt < timeout:
-        retry_cnt += 1
+    # Poll with capped exponential backoff so a server that comes up quickly
+    # is detected quickly, without hammering one that is slow to start
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    attempt = 0
+    while True:
+        attempt += 1
         try:
-            card = await get_agent_card(url)
+            # Don't let a single hanging probe run past the overall deadline
+            remaining = max(deadline - loop.time(), delay)
+            card = await asyncio.wait_for(
+                get_agent_card(url),
+                timeout=min(config.a2a_connect_timeout, remaining),
+            )
             if card is not None:
                 return True
             else:
-                print(
-                    f"Agent card not available yet..., retrying {retry_cnt}/{timeout}"
-                )
+                print(f"Agent card not available yet..., retrying (attempt {attempt})")
         except Exception:
             pass
-        await asyncio.sleep(1)
-    return False
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
 
 
 async def send_message(
     url, message, task_id=None, context_id=None
 ) -> SendMessageResponse:
-    card = await get_agent_card(url)
-    # Configure timeout with separate values for connect, read, write, and pool
-    # Use longer timeouts for agent operations that may take time to process
-    timeout = httpx.Timeout(
-        connect=config.a2a_connect_timeout,
-        read=config.a2a_timeout,
-        write=config.a2a_timeout,
-        pool=config.a2a_connect_timeout,
-    )
-    httpx_client = httpx.AsyncClient(timeout=timeout)
-    client = A2AClient(httpx_client=httpx_client, agent_card=card)
+    # Resolve each agent's card once rather than before every message
+    base_url = url.rstrip("/")
+    card = _agent_cards.get(base_url)
+    if card is None:
+        card = await get_agent_card(base_url)
+        if card is not None:
+            _agent_cards[base_url] = card
+    client = A2AClient(httpx_client=_get_client(), agent_card=card)
 
-    message_id = uuid.uuid4().hex
+    message_id = secrets.token_hex(16)
     params = MessageSendParams(
         message=Message(
             role=Role.user,
@@ -81,7 +115,13 @@ async def send_message(
             context_id=context_id,
         )
     )
-    request_id = uuid.uuid4().hex
+    request_id = secrets.token_hex(16)
     req = SendMessageRequest(id=request_id, params=params)
-    response = await client.send_message(request=req)
+    try:
+        response = await client.send_message(request=req)
+    except Exception:
+        _agent_cards.pop(base_url, None)
+        raise
+    if isinstance(response.root, JSONRPCErrorResponse):
+        _agent_cards.pop(base_url, None)
     return response
@@ -13,7 +13,7 @@ from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCard
 from a2a.utils import new_agent_text_message
-from litellm import completion
+from litellm import acompletion
 
 dotenv.load_dotenv()
 
@@ -24,10 +24,7 @@ def load_agent_card_toml(agent_name):
         return tomllib.load(f)
 
 
-class GeneralWhiteAgentExecutor(AgentExecutor):
-    def __init__(self):
-        self.ctx_id_to_messages = {}
-        self.system_prompt = """You are a mechanical engineering problem-solving assistant. Your task is to solve engineering problems step by step using the available tools.
+SYSTEM_PROMPT = """You are a mechanical engineering problem-solving assistant. Your task is to solve engineering problems step by step using the available tools.
 
 IMPORTANT INSTRUCTIONS:
 1. **Tool Usage Workflow**: Always use tools (calculator, python_exec) to solve problems before providing your final answer. Do NOT guess or provide answers without calculations.
@@ -159,16 +156,21 @@ For Level C and Level D tasks, you MUST follow this exact format:
    - Include units in numerical answers
    - Show your work when possible"""
 
+
+class GeneralWhiteAgentExecutor(AgentExecutor):
+    # Opening message of every conversation. It is never mutated, so all
+    # contexts share this one dict instead of each building its own copy.
+    SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+    def __init__(self):
+        self.ctx_id_to_messages = {}
+        self.system_prompt = SYSTEM_PROMPT
+
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         # parse the task
         user_input = context.get_user_input()
         if context.context_id not in self.ctx_id_to_messages:
-            self.ctx_id_to_messages[context.context_id] = [
-                {
-                    "role": "system",
-                    "content": self.system_prompt,
-                }
-            ]
+            self.ctx_id_to_messages[context.context_id] = [self.SYSTEM_MESSAGE]
         messages = self.ctx_id_to_messages[context.context_id]
         messages.append(
             {
@@ -176,10 +178,12 @@ For Level C and Level D tasks, you MUST follow this exact format:
                 "content": user_input,
             }
         )
+        # Await the async client so the event loop keeps serving other requests
+        # while this completion is in flight
         # Use OpenAI directly (litellm will automatically use OPENAI_API_KEY from environment)
         # Optionally support litellm_proxy if LITELLM_PROXY_API_KEY is set
         if os.environ.get("LITELLM_PROXY_API_KEY") is not None:
-            response = completion(
+            response = await acompletion(
                 messages=messages,
                 model="openrouter/openai/gpt-4o",
                 custom_llm_provider="litellm_proxy",
@@ -187,7 +191,7 @@ For Level C and Level D tasks, you MUST follow this exact format:
             )
         else:
             # Default to OpenAI - requires OPENAI_API_KEY environment variable
-            response = completion(
+            response = await acompletion(
                 messages=messages,
                 model="openai/gpt-4o",
                 custom_llm_provider="openai",
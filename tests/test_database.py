@@ -0,0 +1,103 @@
+"""Tests for benchmark database bulk writes."""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.mechgaia_env.database import BenchmarkDatabase
+
+
+def _count_task_updates(db: BenchmarkDatabase) -> None:
+    """Log every UPDATE of a tasks row into a task_updates table."""
+    conn = sqlite3.connect(db.db_path)
+    conn.executescript("""
+        CREATE TABLE task_updates (id TEXT);
+        CREATE TRIGGER log_task_update AFTER UPDATE ON tasks
+        BEGIN
+            INSERT INTO task_updates VALUES (new.id);
+        END;
+    """)
+    conn.close()
+
+
+def _task_updates(db: BenchmarkDatabase) -> list:
+    """Return the ids logged by _count_task_updates, in update order."""
+    conn = sqlite3.connect(db.db_path)
+    rows = [row[0] for row in conn.execute("SELECT id FROM task_updates")]
+    conn.close()
+    return rows
+
+
+def test_add_tasks_bulk_upsert():
+    """Test insert, idempotent re-insert and update of a changed task."""
+    tasks = [
+        ("a1", "A", "Stress", "LevelATask", {"question": "q1", "options": [1, 2]}),
+        ("b1", "B", "Beams", "LevelBTask", {"formula": "F / A"}),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        db = BenchmarkDatabase(str(Path(tmp) / "tasks.db"))
+        _count_task_updates(db)
+
+        db.add_tasks_bulk(tasks)
+        assert db.get_task_by_id("a1")["schema_data"] == tasks[0][4]
+        assert db.get_task_by_id("b1")["topic"] == "Beams"
+
+        # Re-adding identical tasks writes nothing
+        db.add_tasks_bulk(tasks)
+        assert _task_updates(db) == []
+        assert len(db.get_tasks_by_level("A")) == 1
+
+        # Only the changed task is rewritten
+        changed = ("b1", "B", "Beams", "LevelBTask", {"formula": "F / (2 * A)"})
+        db.add_tasks_bulk([tasks[0], changed])
+        assert _task_updates(db) == ["b1"]
+        assert db.get_task_by_id("b1")["schema_data"] == changed[4]
+        assert len(db.get_tasks_by_level("B")) == 1
+
+
+def test_add_task_instances_bulk():
+    """Test inserting instances and re-inserting the same ids."""
+    instances = [
+        ("b1_0", "b1", {"F": 1000.0}, {"sigma": 10.0}, {"seed": 0}),
+        ("b1_1", "b1", {"F": 2000.0}, {"sigma": 20.0}, None),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        db = BenchmarkDatabase(str(Path(tmp) / "tasks.db"))
+        db.add_tasks_bulk([("b1", "B", "Beams", "LevelBTask", {"formula": "F"})])
+
+        db.add_task_instances_bulk(instances)
+        stored = {row["id"]: row for row in db.get_task_instances("b1")}
+        assert set(stored) == {"b1_0", "b1_1"}
+        assert stored["b1_0"]["parameters"] == {"F": 1000.0}
+        assert stored["b1_0"]["metadata"] == {"seed": 0}
+        assert stored["b1_1"]["metadata"] == {}
+        assert stored["b1_1"]["level"] == "B"
+
+        # Re-inserting the same ids replaces rows instead of duplicating them
+        db.add_task_instances_bulk(instances)
+        updated = ("b1_1", "b1", {"F": 3000.0}, {"sigma": 30.0}, None)
+        db.add_task_instances_bulk([updated])
+        stored = {row["id"]: row for row in db.get_task_instances("b1")}
+        assert len(stored) == 2
+        assert stored["b1_1"]["gold_answer"] == {"sigma": 30.0}
+
+        db.add_task_instances_bulk([])
+        assert len(db.get_task_instances()) == 2
+
+
+if __name__ == "__main__":
+    print("Running database tests...")
+
+    print("\n1. Testing bulk task upsert...")
+    test_add_tasks_bulk_upsert()
+    print("   ✓ Bulk task upsert tests passed")
+
+    print("\n2. Testing bulk task instance insert...")
+    test_add_task_instances_bulk()
+    print("   ✓ Bulk task instance tests passed")
+
+    print("\n✅ All database tests passed!")
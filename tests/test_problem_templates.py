@@ -0,0 +1,87 @@
+"""Tests for Level B problem template rendering."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.mechgaia_env.env import _compile_problem_template
+
+_PARAMETERS = {"F": 1234.5678, "A": 0.02, "material": "steel", "n": 3}
+
+
+def _outcome(render, template: str, parameters: dict):
+    """Return the rendered text, or the type of the exception raised."""
+    try:
+        return render(template, parameters)
+    except Exception as e:
+        return type(e)
+
+
+def _assert_matches_str_format(template: str, parameters: dict = _PARAMETERS):
+    """Check the compiled renderer agrees with str.format on a template."""
+    expected = _outcome(lambda t, p: t.format(**p), template, parameters)
+    actual = _outcome(
+        lambda t, p: _compile_problem_template(t)(p), template, parameters
+    )
+    assert actual == expected, (template, actual, expected)
+
+
+def test_plain_and_escaped_braces():
+    """Test literal text and doubled braces render like str.format."""
+    for template in [
+        "No placeholders at all.",
+        "A force of {F} N acts on {material}.",
+        "Use {{F}} literally, then {F}.",
+        "Set notation {{{n}}} and closing }}",
+        "",
+    ]:
+        _assert_matches_str_format(template)
+
+
+def test_format_specs():
+    """Test format specs and fallback-only fields render like str.format."""
+    for template in [
+        "F = {F:.2f} N, A = {A:.3e} m^2",
+        "{material:>10}|{n:03d}|{F:,.1f}",
+        "Nested width {F:{n}}",
+        "Conversion {material!r}",
+        "Index {material[0]}",
+    ]:
+        _assert_matches_str_format(template)
+
+
+def test_missing_and_malformed_fields():
+    """Test errors match str.format for missing keys and bad templates."""
+    for template in [
+        "Missing {load} here",
+        "Positional {} field",
+        "Unclosed {F",
+        "Stray } brace",
+        "Bad spec {n:q}",
+    ]:
+        _assert_matches_str_format(template)
+
+    # Renderers are reused across parameter sets
+    render = _compile_problem_template("{F:.1f} on {material}")
+    assert render(_PARAMETERS) == "1234.6 on steel"
+    assert render({"F": 1, "material": "aluminum"}) == "1.0 on aluminum"
+
+
+if __name__ == "__main__":
+    print("Running problem template tests...")
+
+    print("\n1. Testing plain text and escaped braces...")
+    test_plain_and_escaped_braces()
+    print("   ✓ Escaped brace tests passed")
+
+    print("\n2. Testing format specs...")
+    test_format_specs()
+    print("   ✓ Format spec tests passed")
+
+    print("\n3. Testing missing and malformed fields...")
+    test_missing_and_malformed_fields()
+    print("   ✓ Missing field tests passed")
+
+    print("\n✅ All problem template tests passed!")
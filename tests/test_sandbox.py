@@ -0,0 +1,221 @@
+"""Tests for the sandboxed Python executor."""
+
+import ast
+import copy
+import importlib
+import pickle
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.mechgaia_env.sandbox import (
+    SandboxExecutor,
+    _assigned_names,
+    _compile_snippet,
+    _LazyModule,
+)
+
+
+def test_lazy_module_copy_and_pickle():
+    """Test that the lazy scipy proxy survives copy and pickle round trips."""
+    proxy = _LazyModule("math")
+    for clone in [copy.copy(proxy), copy.deepcopy(proxy)]:
+        assert clone.sqrt(4.0) == 2.0
+
+    restored = pickle.loads(pickle.dumps(proxy))
+    assert restored.sqrt(9.0) == 3.0
+    assert repr(restored) == "<lazy module 'math'>"
+
+    # Module dunders are forwarded like any other attribute
+    numpy_proxy = _LazyModule("numpy")
+    assert numpy_proxy.__version__ == np.__version__
+    assert numpy_proxy.__name__ == "numpy"
+    output = SandboxExecutor(isolated=False).execute("scipy.__version__")
+    assert output["error"] is None
+    assert output["result"] == importlib.import_module("scipy").__version__
+
+
+def test_compile_snippet_splits_trailing_expression():
+    """Test the trailing expression is compiled apart from the statements."""
+    exec_code, last_expr, names = _compile_snippet("a = 2\nb = a * 3\nb + 1")
+    namespace = {}
+    exec(exec_code, namespace)
+    assert eval(last_expr, namespace) == 7
+    assert names == ("a", "b")
+
+    _, last_expr, _ = _compile_snippet("a = 2")
+    assert last_expr is None
+
+
+def test_assigned_names_skip_nested_scopes():
+    """Test only module-level assignments are collected, in source order."""
+    source = "\n".join(
+        [
+            "x, y = 1, 2",
+            "def f():",
+            "    inner = 3",
+            "squares = [k * k for k in range(3)]",
+            "for i in range(2):",
+            "    total = i",
+            "x = 5",
+        ]
+    )
+    assert _assigned_names(ast.parse(source)) == (
+        "x",
+        "y",
+        "squares",
+        "i",
+        "total",
+    )
+
+
+def test_execute_result_extraction():
+    """Test explicit, trailing-expression and heuristic results."""
+
+    def run(code):
+        # Fresh executor per snippet, since state (including result) persists
+        return SandboxExecutor(isolated=False).execute(code)["result"]
+
+    assert run("x = 3\nresult = x * 2") == 6
+    assert run("x = 3\nx ** 2") == 9
+    # Without a result or trailing expression, result-like names win
+    assert run("delta_l = 0.5\nscale = 10") == 0.5
+    assert run("p = 1\nq = 2") == 2
+
+
+def test_execute_syntax_error():
+    """Test syntax errors are reported and leave state untouched."""
+    executor = SandboxExecutor(isolated=False)
+    executor.execute("kept = 1")
+    output = executor.execute("kept = (")
+    assert output["result"] is None
+    assert output["error"]
+    assert executor.persistent_namespace["kept"] == 1
+
+    output = executor.execute("1 / 0")
+    assert "division by zero" in output["error"]
+
+
+def test_output_capture_resets_between_runs():
+    """Test stdout/stderr are captured per run and buffers start empty."""
+    executor = SandboxExecutor(isolated=False)
+    original_streams = (sys.stdout, sys.stderr)
+    output = executor.execute(
+        "import sys\nprint('first')\nprint('oops', file=sys.stderr)"
+    )
+    assert output["stdout"] == "first\n"
+    assert output["stderr"] == "oops\n"
+
+    output = executor.execute("print('second')")
+    assert output["stdout"] == "second\n"
+    assert output["stderr"] == ""
+    assert (sys.stdout, sys.stderr) == original_streams
+
+
+def test_output_capture_concurrent_runs():
+    """Test concurrent runs on one executor each capture only their output."""
+    executor = SandboxExecutor(isolated=False)
+    original_streams = (sys.stdout, sys.stderr)
+    outputs = {}
+
+    def run(i):
+        code = f"import time\nfor _ in range(50):\n    print('t{i}')\n    time.sleep(0.001)"
+        outputs[i] = executor.execute(code)["stdout"]
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for i, stdout in outputs.items():
+        assert stdout == f"t{i}\n" * 50
+    # The process-wide streams are put back once the last run finishes
+    assert (sys.stdout, sys.stderr) == original_streams
+
+
+def test_isolated_execution_keeps_state():
+    """Test isolated runs return results and carry picklable state over."""
+    executor = SandboxExecutor(isolated=True)
+    output = executor.execute("s = scipy\nv = 1")
+    assert output["error"] is None
+    assert output["result"] == 1
+    assert executor.execute("v + 1")["result"] == 2
+
+
+def test_isolated_unpicklable_variables():
+    """Test unpicklable variables return an error and keep the worker usable."""
+    executor = SandboxExecutor(isolated=True)
+    executor.execute("v = 1")
+    output = executor.execute("f()", variables={"f": lambda: 1})
+    assert output["result"] is None
+    assert output["error"].startswith("Cannot send variables to sandbox worker")
+    assert executor.execute("v + 1")["result"] == 2
+
+
+def test_isolated_timeout_and_recovery():
+    """Test a timed-out run is killed without affecting other executors."""
+    slow = SandboxExecutor(isolated=True)
+    other = SandboxExecutor(isolated=True)
+    slow.execute("x = 41")
+    other.execute("y = 0")
+
+    other_output = {}
+
+    def run_other():
+        other_output.update(other.execute("import time\ntime.sleep(1.5)\ny + 7"))
+
+    thread = threading.Thread(target=run_other)
+    thread.start()
+    start = time.perf_counter()
+    output = slow.execute("while True:\n    pass", timeout=1)
+    thread.join()
+
+    assert output["error"] == "Execution timeout after 1 seconds"
+    assert time.perf_counter() - start < 10
+    # The concurrent run on another executor's worker is not aborted
+    assert other_output["error"] is None
+    assert other_output["result"] == 7
+
+    # A fresh worker picks up the state from before the timeout
+    assert slow.execute("x + 1")["result"] == 42
+
+
+if __name__ == "__main__":
+    print("Running sandbox tests...")
+
+    print("\n1. Testing lazy module proxy...")
+    test_lazy_module_copy_and_pickle()
+    print("   ✓ Lazy module tests passed")
+
+    print("\n2. Testing snippet compilation...")
+    test_compile_snippet_splits_trailing_expression()
+    test_assigned_names_skip_nested_scopes()
+    print("   ✓ Compilation tests passed")
+
+    print("\n3. Testing result extraction...")
+    test_execute_result_extraction()
+    test_execute_syntax_error()
+    print("   ✓ Result extraction tests passed")
+
+    print("\n4. Testing output capture...")
+    test_output_capture_resets_between_runs()
+    test_output_capture_concurrent_runs()
+    print("   ✓ Output capture tests passed")
+
+    print("\n5. Testing isolated execution...")
+    test_isolated_execution_keeps_state()
+    test_isolated_unpicklable_variables()
+    print("   ✓ Isolated execution tests passed")
+
+    print("\n6. Testing isolated timeout and recovery...")
+    test_isolated_timeout_and_recovery()
+    print("   ✓ Timeout recovery tests passed")
+
+    print("\n✅ All sandbox tests passed!")
@@ -0,0 +1,145 @@
+"""Tests for benchmark score statistics."""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.mechgaia_env.config import config
+from src.mechgaia_env.statistics import (
+    _cached_bootstrap_means,
+    _two_percentiles,
+    aggregate_scores,
+    aggregate_scores_batch,
+    bootstrap_confidence_interval,
+    build_score_arrays,
+    generate_jsonl_report,
+    statistical_significance_test,
+)
+
+
+def test_two_percentiles_matches_numpy():
+    """Test partition-based percentiles against np.percentile."""
+    rng = np.random.default_rng(0)
+    for size in [1, 2, 7, 1000]:
+        values = rng.normal(size=size)
+        for q_lower, q_upper in [(2.5, 97.5), (0, 100), (50, 50)]:
+            expected = np.percentile(values, [q_lower, q_upper])
+            actual = _two_percentiles(values, q_lower, q_upper)
+            assert np.allclose(actual, expected)
+
+
+def test_bootstrap_confidence_interval():
+    """Test bootstrap CI bounds for discrete and continuous scores."""
+    mean, lower, upper = bootstrap_confidence_interval([1.0] * 10)
+    assert mean == lower == upper == 1.0
+
+    scores = np.random.default_rng(1).random(200)
+    mean, lower, upper = bootstrap_confidence_interval(scores)
+    assert lower < mean < upper
+
+    assert bootstrap_confidence_interval([]) == (0.0, 0.0, 0.0)
+
+
+def test_aggregate_scores():
+    """Test aggregation from evaluation dicts and precomputed arrays."""
+    evaluations = [
+        {"scores": '{"correctness": 1.0, "reasoning": 0.5}'},
+        {"scores": {"correctness": 0.0}},
+        {"scores": {}},
+    ]
+
+    arrays = build_score_arrays(evaluations, ["correctness", "reasoning"])
+    assert arrays["correctness"].tolist() == [1.0, 0.0]
+    assert arrays["reasoning"].tolist() == [0.5]
+
+    from_dicts = aggregate_scores(evaluations)
+    from_array = aggregate_scores(arrays["correctness"])
+    assert from_dicts["n"] == from_array["n"] == 2
+    assert from_dicts["mean"] == from_array["mean"] == 0.5
+
+    assert aggregate_scores([])["n"] == 0
+
+
+def test_aggregate_scores_batch():
+    """Test batched aggregation grouped by model."""
+    evaluations = [
+        {"model_name": "a", "scores": {"correctness": 1.0, "reasoning": 1.0}},
+        {"model_name": "a", "scores": {"correctness": 0.0}},
+        {"model_name": "b", "scores": '{"correctness": 1.0}'},
+    ]
+
+    results = aggregate_scores_batch(evaluations, ["correctness", "reasoning"])
+    assert results[("a", "correctness")]["mean"] == 0.5
+    assert results[("a", "reasoning")]["n"] == 1
+    assert results[("b", "correctness")]["mean"] == 1.0
+    assert results[("b", "reasoning")]["n"] == 0
+
+
+def test_significance_test_draws_samples_independently():
+    """Test that equal score lists are resampled independently."""
+    scores = [1.0, 0.0, 1.0, 0.0, 1.0]
+    result = statistical_significance_test(scores, list(scores))
+    assert result["ci_lower"] < 0 < result["ci_upper"]
+    assert not result["significant"]
+
+    # The first sample reuses the draws from its confidence interval
+    bootstrap_confidence_interval(scores, n_iterations=config.bootstrap_iterations)
+    hits = _cached_bootstrap_means.cache_info().hits
+    statistical_significance_test(scores, list(scores))
+    assert _cached_bootstrap_means.cache_info().hits == hits + 1
+
+    result = statistical_significance_test([1.0] * 20 + [0.0], [0.0] * 20 + [1.0])
+    assert result["significant"]
+    assert result["mean_diff"] > 0.5
+    assert result["p_value"] < 0.05
+
+
+def test_generate_jsonl_report_numpy_scores():
+    """Test that reports serialize NumPy float scores like plain floats."""
+    evaluations = [
+        {"task_instance_id": "t1", "model_name": "a", "scores": {"x": np.float64(0.5)}},
+        {"task_instance_id": "t2", "model_name": "b", "scores": {"x": 1.0}},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "report.jsonl"
+        generate_jsonl_report(evaluations, str(path))
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert [r["scores"]["x"] for r in records] == [0.5, 1.0]
+    assert records[0]["task_instance_id"] == "t1"
+
+
+if __name__ == "__main__":
+    print("Running statistics tests...")
+
+    print("\n1. Testing partition-based percentiles...")
+    test_two_percentiles_matches_numpy()
+    print("   ✓ Percentile tests passed")
+
+    print("\n2. Testing bootstrap confidence interval...")
+    test_bootstrap_confidence_interval()
+    print("   ✓ Bootstrap CI tests passed")
+
+    print("\n3. Testing score aggregation...")
+    test_aggregate_scores()
+    print("   ✓ Aggregation tests passed")
+
+    print("\n4. Testing batched aggregation...")
+    test_aggregate_scores_batch()
+    print("   ✓ Batched aggregation tests passed")
+
+    print("\n5. Testing significance test...")
+    test_significance_test_draws_samples_independently()
+    print("   ✓ Significance test tests passed")
+
+    print("\n6. Testing JSONL report...")
+    test_generate_jsonl_report_numpy_scores()
+    print("   ✓ JSONL report tests passed")
+
+    print("\n✅ All statistics tests passed!")
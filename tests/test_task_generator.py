@@ -0,0 +1,166 @@
+"""Tests for benchmark task generation."""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.mechgaia_env.database import BenchmarkDatabase
+from src.mechgaia_env.task_generator import (
+    TaskGenerator,
+    _formula_function,
+    _sample_design_instances,
+    _sample_formula_instances,
+)
+
+_TIMESTAMP_FIELDS = ("created_at",)
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "data" / "level_d" / "examples"
+
+
+def test_level_d_requires_level_field():
+    """Test that Level D loading skips files without level "D"."""
+    example = json.loads((EXAMPLES_DIR / "level_d_frame_1.json").read_text())
+    with tempfile.TemporaryDirectory() as tmp:
+        examples_dir = Path(tmp) / "examples"
+        examples_dir.mkdir()
+        shutil.copy(EXAMPLES_DIR / "level_d_frame_1.json", examples_dir)
+        no_level = {k: v for k, v in example.items() if k != "level"}
+        no_level["id"] = "no_level"
+        (examples_dir / "no_level.json").write_text(json.dumps(no_level))
+        (examples_dir / "level_b.json").write_text(
+            json.dumps({**example, "id": "level_b", "level": "B"})
+        )
+
+        generator = TaskGenerator(BenchmarkDatabase(str(Path(tmp) / "tasks.db")))
+        loaded = generator.generate_level_d_tasks(examples_dir)
+
+    assert loaded == [example["id"]]
+
+
+def _generate_all(db_path: str, seed: int) -> tuple[list, list]:
+    """Generate Level A-C tasks and instances with a seeded generator.
+
+    Returns:
+        Tuple of (tasks, instances) as stored, without timestamps
+    """
+    db = BenchmarkDatabase(db_path)
+    generator = TaskGenerator(db, seed=seed)
+    generator.generate_level_a_tasks()
+    generator.generate_level_b_tasks()
+    generator.generate_level_c_tasks()
+
+    tasks = [task for level in "ABC" for task in db.get_tasks_by_level(level)]
+    for task in tasks:
+        generator.generate_task_instances(task["id"], num_instances=3)
+    instances = sorted(db.get_task_instances(), key=lambda row: row["id"])
+
+    def strip(rows):
+        return [
+            {k: v for k, v in row.items() if k not in _TIMESTAMP_FIELDS} for row in rows
+        ]
+
+    return strip(tasks), strip(instances)
+
+
+def test_same_seed_same_tasks():
+    """Test that equally seeded generators produce identical tasks."""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = _generate_all(str(Path(tmp) / "first.db"), seed=42)
+        second = _generate_all(str(Path(tmp) / "second.db"), seed=42)
+        other = _generate_all(str(Path(tmp) / "other.db"), seed=7)
+
+    tasks, instances = first
+    assert tasks and instances
+    assert first == second
+    # Sampled Level B references and B/C instance parameters depend on the seed
+    assert other != first
+
+
+def test_sample_formula_instances_structure():
+    """Test sampled parameters and solutions match per-instance evaluation."""
+    ranges = {"F": {"min": 100.0, "max": 200.0}, "A": {"min": 1.0, "max": 2.0}}
+    parameters, solutions = _sample_formula_instances(
+        "F / A", ranges, 5, np.random.default_rng(0)
+    )
+
+    assert len(parameters) == len(solutions) == 5
+    for params, solution in zip(parameters, solutions):
+        assert list(params) == ["F", "A"]
+        assert all(type(value) is float for value in params.values())
+        assert 100.0 <= params["F"] <= 200.0 and 1.0 <= params["A"] <= 2.0
+        assert type(solution) is float
+        assert solution == params["F"] / params["A"]
+
+    # A formula that cannot be evaluated gives 0.0 for every instance
+    _, solutions = _sample_formula_instances(
+        "F / 0", ranges, 3, np.random.default_rng(0)
+    )
+    assert solutions == [0.0, 0.0, 0.0]
+
+
+def test_sample_design_instances_structure():
+    """Test sampled designs keep declared variable order, types and ranges."""
+    design_variables = {
+        "material": {"type": "categorical", "options": ["steel", "aluminum"]},
+        "width": {"type": "continuous", "min": 0.1, "max": 0.5},
+        "shape": {"type": "discrete", "options": ["I", "box", "round"]},
+        "height": {"type": "continuous", "min": 1.0, "max": 2.0},
+    }
+    parameters = _sample_design_instances(design_variables, 6, np.random.default_rng(0))
+
+    assert len(parameters) == 6
+    for params in parameters:
+        assert list(params) == list(design_variables)
+        assert params["material"] in ["steel", "aluminum"]
+        assert params["shape"] in ["I", "box", "round"]
+        assert type(params["width"]) is float and 0.1 <= params["width"] <= 0.5
+        assert type(params["height"]) is float and 1.0 <= params["height"] <= 2.0
+
+    assert _sample_design_instances({}, 2, np.random.default_rng(0)) == [{}, {}]
+    assert _sample_design_instances(design_variables, 0, np.random.default_rng(0)) == []
+
+
+def test_formula_function_checks_and_evaluates():
+    """Test formulas compile to functions of floats and arrays, and only those."""
+    deflection = _formula_function("P * L**3 / (3 * E * I)", ("P", "L", "E", "I"))
+    assert deflection(P=3.0, L=2.0, E=4.0, I=1.0) == 2.0
+    values = deflection(P=np.array([3.0, 6.0]), L=2.0, E=4.0, I=1.0)
+    assert values.tolist() == [2.0, 4.0]
+
+    for formula in ["__import__('os')", "P.real", "P % 2", "Q + P", "True + P"]:
+        try:
+            _formula_function(formula, ("P",))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Formula should be rejected: {formula}")
+
+
+if __name__ == "__main__":
+    print("Running task generator tests...")
+
+    print("\n1. Testing Level D level filter...")
+    test_level_d_requires_level_field()
+    print("   ✓ Level D filter tests passed")
+
+    print("\n2. Testing seeded generation...")
+    test_same_seed_same_tasks()
+    print("   ✓ Seeded generation tests passed")
+
+    print("\n3. Testing vectorized sampling...")
+    test_sample_formula_instances_structure()
+    test_sample_design_instances_structure()
+    print("   ✓ Sampling structure tests passed")
+
+    print("\n4. Testing formula compilation...")
+    test_formula_function_checks_and_evaluates()
+    print("   ✓ Formula compilation tests passed")
+
+    print("\n✅ All task generator tests passed!")
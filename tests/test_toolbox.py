@@ -0,0 +1,149 @@
+"""Tests for the engineering toolbox."""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import sympy as sp
+
+from src.mechgaia_env.toolbox import MaterialDatabase, MathEngine
+
+
+def _default_database() -> MaterialDatabase:
+    """Database with the built-in default materials."""
+    return MaterialDatabase(Path(__file__).parent / "missing_materials.json")
+
+
+def test_filter_materials():
+    """Test range filters against a per-material scan of the dict API."""
+    db = _default_database()
+    assert db.filter_materials() == db.list_materials()
+
+    strong = db.filter_materials(yield_strength=(300e6, None))
+    expected = [
+        name
+        for name in db.list_materials()
+        if db.get_material_properties(name)["yield_strength"] >= 300e6
+    ]
+    assert strong == expected
+
+    light_and_strong = db.filter_materials(
+        yield_strength=(300e6, None), density=(None, 3000)
+    )
+    assert light_and_strong == ["composite"]
+
+    try:
+        db.filter_materials(hardness=(0, None))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Unknown property should raise ValueError")
+
+
+def test_material_databases_do_not_share_properties():
+    """Test that mutating one database leaves the cached file data intact."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "materials.json"
+        path.write_text(json.dumps({"Steel": {"yield_strength": 250e6}}))
+        first = MaterialDatabase(path)
+        second = MaterialDatabase(path)
+
+        first.get_material_properties("STEEL")["yield_strength"] = 1.0
+        first.materials["brass"] = {"yield_strength": 200e6}
+
+        assert second.get_material_properties("steel") == {"yield_strength": 250e6}
+        assert second.list_materials() == ["steel"]
+        assert MaterialDatabase(path).materials == {"steel": {"yield_strength": 250e6}}
+
+
+def test_symbolic_solve_matches_sympy():
+    """Test numeric polynomial roots against sp.solve."""
+    engine = MathEngine()
+    for equation in [
+        "2*x - 7",
+        "x**2 - 2",
+        "(x - 2)**3*(x + 1)",
+        "x**3 - 1",
+        "x**2 - 2.0*x + 1.0",
+        "x**2 - 0.2*x + 0.01",
+        "(x - 0.3)**3*(x + 1.5)",
+        "0.5*x**2 - 3.2*x + 1.1",
+    ]:
+        expected = sp.solve(sp.sympify(equation), sp.Symbol("x"))
+        actual = engine.symbolic_solve(equation, "x")
+        assert len(actual) == len(expected)
+        for root, exact in zip(actual, expected):
+            assert abs(complex(root) - complex(exact)) < 1e-9
+
+    # Non-polynomial and symbolic equations are still solved exactly
+    assert engine.symbolic_solve("sin(x) - 1", "x") == [sp.pi / 2]
+    assert engine.symbolic_solve("a*x + b", "x") == [sp.sympify("-b/a")]
+
+
+def test_evaluate_formula_rejects_unsafe_expressions():
+    """Test that formulas are limited to arithmetic and NumPy math."""
+    engine = MathEngine()
+    assert engine.evaluate_formula("F / A", {"F": 10.0, "A": 2.0}) == 5.0
+    assert engine.evaluate_formula("sqrt(x) + np.sum([x, 1])", {"x": 4.0}) == 7.0
+
+    for formula in [
+        "np.load('data.npy')",
+        "np.__class__",
+        "().__class__.__bases__",
+        "__import__('os')",
+        "[x for x in ()]",
+    ]:
+        try:
+            engine.evaluate_formula(formula, {})
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Formula should be rejected: {formula}")
+
+
+def test_evaluate_formula_batch_matches_per_element():
+    """Test batched evaluation against evaluate_formula on each element."""
+    engine = MathEngine()
+    variables = {"F": np.array([1.0, 5.0, 3.0]), "A": 2.0}
+    for formula in [
+        "F / A",
+        "sqrt(F) * np.clip(F, 0, 2)",
+        "2 * pi",
+        "np.max(F)",
+        "np.sum([F, A])",
+        "F if F > A else A",
+    ]:
+        expected = [
+            engine.evaluate_formula(formula, {"F": f, "A": 2.0}) for f in variables["F"]
+        ]
+        actual = engine.evaluate_formula_batch(formula, variables)
+        assert actual.shape == (3,)
+        assert np.allclose(actual, expected), formula
+
+
+if __name__ == "__main__":
+    print("Running toolbox tests...")
+
+    print("\n1. Testing material database...")
+    test_filter_materials()
+    test_material_databases_do_not_share_properties()
+    print("   ✓ Material database tests passed")
+
+    print("\n2. Testing symbolic solve...")
+    test_symbolic_solve_matches_sympy()
+    print("   ✓ Symbolic solve tests passed")
+
+    print("\n3. Testing formula restrictions...")
+    test_evaluate_formula_rejects_unsafe_expressions()
+    print("   ✓ Formula restriction tests passed")
+
+    print("\n4. Testing batched formula evaluation...")
+    test_evaluate_formula_batch_matches_per_element()
+    print("   ✓ Batched formula tests passed")
+
+    print("\n✅ All toolbox tests passed!")
@@ -9,6 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.mechgaia_env.response_parser import (
     extract_json_from_response,
     parse_response,
+    parse_responses,
 )
 
 
@@ -241,6 +242,26 @@ The key difference between yield strength and ultimate strength is that yield st
     assert len(parsed["explanation"]) > 0
 
 
+def test_batch_parsing():
+    """Test that batch parsing matches parsing each response on its own."""
+    responses = [
+        "I believe Option 3 is correct.",
+        "The correct answer is 1",
+        "After reviewing, option 4 best describes the behavior.",
+    ]
+
+    expected = [
+        parse_response(r, task_type="multiple_choice", num_options=4) for r in responses
+    ]
+
+    assert parse_responses(responses, task_type="multiple_choice") == expected
+    assert (
+        parse_responses(responses, task_type="multiple_choice", max_workers=2)
+        == expected
+    )
+    assert [p["selected_option"] for p in expected] == [2, 0, 3]
+
+
 if __name__ == "__main__":
     print("Running white-agent parsing tests...")
 
@@ -268,4 +289,8 @@ if __name__ == "__main__":
     test_level_a_parsing()
     print("   ✓ Level A parsing tests passed")
 
+    print("\n7. Testing batch parsing...")
+    test_batch_parsing()
+    print("   ✓ Batch parsing tests passed")
+
     print("\n✅ All white-agent parsing tests passed!")